@@ -29,21 +29,27 @@ from .tileset import Tileset
 from .timeManager import TimeManager,Timer,SceneTimer
 from .easingController import EasingController
 from .propertyEaser import PropertyEaser
+from .tweenManager import TweenManager
 from .cutsceneManager import CutsceneManager
 import batFramework.cutscene as cutscene
-from .audioManager import AudioManager
+from .audioManager import AudioManager, Playlist
 import batFramework.transition as transition
 from .action import Action
 from .actionContainer import *
+from .inputState import InputState
 from .camera import Camera
+from .inputRouter import InputRouter, InputSnapshot
 from .entity import Entity
 from .drawable import Drawable
+from .lightEntity import LightEntity, LightDrawable
+from .transformStore import TransformStore
 from .renderGroup import RenderGroup
 from .dynamicEntity import DynamicEntity
 from .sprite import Sprite
 from .scrollingSprite import ScrollingSprite
 from .particle import *
 from .animation import Animation
+from .animationSystem import AnimationSystem
 from .animatedSprite import AnimatedSprite
 from .stateMachine import State, StateMachine
 from .sceneLayer import SceneLayer
@@ -51,6 +57,7 @@ from .scene import Scene
 from .baseScene import BaseScene
 import batFramework.gui as gui
 from .sceneManager import SceneManager
+from .inputRecorder import InputRecorder, InputReplayer
 from .manager import Manager
 from .templates import *
 
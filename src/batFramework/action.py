@@ -23,6 +23,7 @@ class Action:
         self._gamepad_button_control: set = set()
         self._gamepad_axis_control: set = set()
         self._holding = set()
+        self._containers = set()  # ActionContainers indexing this action
 
     def __bool__(self) -> bool :
         return self.active
@@ -48,12 +49,32 @@ class Action:
         self.active = value
         
 
+    def _controls_changed(self) -> None:
+        for container in self._containers:
+            container.invalidate_index()
+
+    def get_dispatch_keys(self) -> set[tuple[int, int | None]]:
+        """
+        Returns the (event type, key/button) pairs this action reacts to.
+        A None key/button means every event of that type.
+        """
+        keys = {(event_type, None) for event_type in self._event_control}
+        for key in self._key_control:
+            keys.add((pygame.KEYDOWN, key))
+            keys.add((pygame.KEYUP, key))
+        for button in self._mouse_control:
+            keys.add((pygame.MOUSEBUTTONDOWN, button))
+            keys.add((pygame.MOUSEBUTTONUP, button))
+        return keys
+
     def add_event_control(self, *events) -> Self:
         self._event_control.update(events)
+        self._controls_changed()
         return self
 
     def remove_event_control(self, *events) -> Self:
-        self._event_control = self._event_control - events
+        self._event_control = self._event_control - set(events)
+        self._controls_changed()
         return self
 
     def add_key_control(self, *keys) -> Self:
@@ -67,6 +88,7 @@ class Action:
             Action: The updated Action object for method chaining.
         """
         self._key_control.update(keys)
+        self._controls_changed()
         return self
 
     def remove_key_control(self, *keys: int) -> Self:
@@ -80,6 +102,7 @@ class Action:
             Action: The updated Action object for method chaining.
         """
         self._key_control = self._key_control - set(keys)
+        self._controls_changed()
         return self
 
     def replace_key_control(self, key, new_key) -> Self:
@@ -100,10 +123,12 @@ class Action:
             Action: The updated Action object for method chaining.
         """
         self._mouse_control.update(mouse)
+        self._controls_changed()
         return self
 
     def remove_mouse_control(self, *mouse: int) -> Self:
         self._mouse_control = self._mouse_control - set(mouse)
+        self._controls_changed()
         return self
 
     def replace_mouse_control(self, mouse, new_mouse) -> Self:
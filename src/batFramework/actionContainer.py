@@ -3,8 +3,15 @@ import pygame
 
 
 class ActionContainer:
+    """
+    Holds named actions and dispatches events to them.
+    Events are only given to the actions controlled by their type and key/button :
+    the container indexes its actions by (event type, key/button) and rebuilds that index
+    when an action is added, removed, or its controls change.
+    """
     def __init__(self, *actions: list[bf.Action]) -> None:
         self._actions: dict[str, bf.Action] = {}
+        self._index: dict[tuple[int, int | None], list[bf.Action]] | None = None
         if actions:
             self.add_actions(*actions)
 
@@ -15,10 +22,15 @@ class ActionContainer:
         return self._actions[key]
 
     def __setitem__(self, key, value):
+        if key in self._actions:
+            self._release(self._actions[key])
         self._actions[key] = value
+        value._containers.add(self)
+        self.invalidate_index()
 
     def __delitem__(self, key):
-        del self._actions[key]
+        self._release(self._actions.pop(key))
+        self.invalidate_index()
 
     def __contains__(self, key):
         return key in self._actions
@@ -28,12 +40,39 @@ class ActionContainer:
 
 
 
+    def _release(self, action: bf.Action) -> None:
+        if action not in self._actions.values():
+            action._containers.discard(self)
+
+    def invalidate_index(self):
+        """
+        Called by actions when their controls change
+        """
+        self._index = None
+
+    def _build_index(self):
+        index: dict[tuple[int, int | None], list[bf.Action]] = {}
+        for action in self._actions.values():
+            for key in action.get_dispatch_keys():
+                index.setdefault(key, []).append(action)
+        self._index = index
+
+    def get_event_types(self) -> set[int]:
+        """
+        Returns the event types the actions react to
+        """
+        return {event_type for action in self._actions.values() for event_type, _ in action.get_dispatch_keys()}
+
     def clear(self):
+        actions = list(self._actions.values())
         self._actions = {}
+        for action in actions:
+            self._release(action)
+        self.invalidate_index()
 
     def add_actions(self, *actions: bf.Action):
         for action in actions:
-            self._actions[action.name] = action
+            self[action.name] = action
 
     def get(self, name: str) -> bf.Action:
         return self._actions.get(name)
@@ -59,7 +98,28 @@ class ActionContainer:
     def process_event(self, event):
         if event.consumed:
             return
-        for action in self._actions.values():
+        if self._index is None:
+            self._build_index()
+        event_type = event.type
+        actions = self._index.get((event_type, None))
+        if event_type == pygame.KEYDOWN or event_type == pygame.KEYUP:
+            control = event.key
+        elif event_type == pygame.MOUSEBUTTONDOWN or event_type == pygame.MOUSEBUTTONUP:
+            control = event.button
+        else:
+            control = None
+        if control is not None:
+            controlled = self._index.get((event_type, control))
+            if controlled:
+                if actions:
+                    # keep container order, an action may be in both lists
+                    order = {id(a): i for i, a in enumerate(self._actions.values())}
+                    actions = sorted({id(a): a for a in actions + controlled}.values(), key=lambda a: order[id(a)])
+                else:
+                    actions = controlled
+        if not actions:
+            return
+        for action in actions:
             action.process_event(event)
             if event.consumed == True:
                 break
@@ -2,29 +2,86 @@ import batFramework as bf
 import pygame
 from typing import List, Dict, Tuple, Union, Optional, Self, Callable, Any
 from .animation import Animation
+from .animationSystem import AnimationSystem
 
 class AnimatedSprite(bf.Drawable):
     def __init__(self,*args,**kwargs) -> None:
         super().__init__((0,0),*args,**kwargs)
         self.animations : dict[str,Animation] = {}
-        self.counter = 0 # int counter
-        self._fcounter = 0.0 # counter
+        self._fcounter = 0.0 # counter (used when not handled by an AnimationSystem)
         self.current_animation : str = None
         self.end_callback : Callable[[],Any] = None
         self._flipX : bool = False
         self.animation_loop : int = -1
         self.queued_animation : str = None
+        # AnimationSystem data
+        self.use_animation_system : bool = True # register in the parent layer's AnimationSystem
+        self.animation_system : AnimationSystem | None = None
+        self._cycle_start : float = 0.0
+        self._cycle_version : int = 0
 
     @property
     def flipX(self)->bool:
         return self._flipX
-    
+
     @flipX.setter
     def flipX(self,value:bool):
         self._flipX = value
 
+    @property
+    def counter(self)->int:
+        return int(self.get_counter())
+
+    @counter.setter
+    def counter(self,value:int):
+        self.set_counter(value)
+
+    def get_counter(self)->float:
+        if self.animation_system is not None:
+            return self.animation_system.get_counter(self)
+        return self._fcounter
+
+    def set_counter(self,value:float)->Self:
+        if self.animation_system is not None:
+            self.animation_system.set_counter(self,value)
+        else:
+            self._fcounter = value
+        return self
+
+    def set_use_animation_system(self,value:bool)->Self:
+        """
+        If True (default), the sprite is advanced by the AnimationSystem of its layer
+        instead of doing its own bookkeeping in update
+        """
+        self.use_animation_system = value
+        self.set_animation_system(self.parent_layer.animation_system if value and self.parent_layer else None)
+        return self
+
+    def set_animation_system(self,system:AnimationSystem|None)->Self:
+        if system is self.animation_system:
+            return self
+        counter = self.get_counter()
+        if self.animation_system is not None:
+            self.animation_system.unregister(self)
+        self.animation_system = system
+        if system is not None:
+            system.register(self,counter)
+        else:
+            self._fcounter = counter
+        return self
+
+    def set_parent_layer(self, layer):
+        super().set_parent_layer(layer)
+        self.set_animation_system(layer.animation_system if layer is not None and self.use_animation_system else None)
+
+    def set_parent_scene(self, scene) -> Self:
+        super().set_parent_scene(scene)
+        if scene is None: # removed from its layer
+            self.set_animation_system(None)
+        return self
+
     def set_animation_end_callback(self,callback : Callable[[],Any]):
-        self.end_callback = callback 
+        self.end_callback = callback
 
     def add_animation(self,animation:Animation)->Self:
         self.animations[animation.name] = animation
@@ -32,7 +89,7 @@ class AnimatedSprite(bf.Drawable):
             self.rect.size = animation.frames[0].get_size()
             self.surface = animation.frames[0].copy()
         return self
-    
+
     def set_animation(self,name:str,reset_counter:bool=True,loop:int=-1,queued_animation:str=None):
         """
         Sets the current animation,
@@ -41,41 +98,44 @@ class AnimatedSprite(bf.Drawable):
         if name not in self.animations :
             return
         self.current_animation = name
-        if reset_counter:
-            self._fcounter = 0
-            self.counter = 0
         self.animation_loop = loop
         if loop != -1:
             self.queued_animation = queued_animation
         else:
             self.queued_animation = None
+        if reset_counter:
+            self.set_counter(0)
+        elif self.animation_system is not None:
+            self.animation_system.schedule(self)
 
     def get_current_frame(self)->int|None:
         if not self.current_animation:
             return None
-        return  self.animations[self.current_animation].counter_to_frame(self._fcounter)        
+        return  self.animations[self.current_animation].counter_to_frame(self.get_counter())
+
+    def _end_cycle(self):
+        """
+        Called once each time the current animation completes a cycle
+        """
+        # wrap the counter around to start the next cycle
+        self.set_counter(self.get_counter() - self.animations[self.current_animation].duration_list_length)
+        if self.animation_loop > 0:
+            self.animation_loop -= 1
+        elif self.queued_animation is not None:
+            self.set_animation(self.queued_animation,True)
+
+        if self.end_callback:
+            self.end_callback()
 
     def update(self, dt):
-        super().update(dt)        
-        if not self.current_animation:
+        super().update(dt)
+        if not self.current_animation or self.animation_system is not None:
             return
-        self._fcounter += dt * 60 
-        self.counter = int(self._fcounter)
-        # self.counter = self.get_current_frame()
-        # print(f"{self.current_animation}:{self.counter}/{self.animations[self.current_animation].duration_list_length}")
-        if self.counter >= self.animations[self.current_animation].duration_list_length:
+        self._fcounter += dt * 60
+        if self._fcounter >= self.animations[self.current_animation].duration_list_length:
             #one animation cycle ended
-            if self.animation_loop > 0:
-                self.animation_loop -= 1
-            elif self.queued_animation is not None:
-                # print("set to queued :",self.queued_animation)
-                self.set_animation(self.queued_animation,True)
-
-            if self.end_callback:
-                self.end_callback()            
- 
+            self._end_cycle()
+
     def draw(self, camera):
-        # print(self.current_animation, f"{self.counter}/{self.animations[self.current_animation].duration_list_length}")
-        self.surface = self.animations[self.current_animation].get_frame(self.counter,self.flipX)#,(0,0)
+        self.surface = self.animations[self.current_animation].get_frame(self.get_counter(),self.flipX)
         super().draw(camera)
-        
\ No newline at end of file
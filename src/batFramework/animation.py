@@ -27,30 +27,36 @@ class Animation:
         """
         self.name = name
         self.frames: list[pygame.Surface] = []
-        self.frames_flipX : list[pygame.Surface] = []
+        self._frames_flipX : list[pygame.Surface | None] = [] # filled on first request
         self.duration_list = []
         self.duration_list_length = 0
         self.numFrames : int = 0
+        self.frame_table : list[int] = [] # frame index for each counter value of a cycle
 
-    def from_surface(self,surface:pygame.Surface,frame_size : Tuple[int,int])->Self:
+    @property
+    def frames_flipX(self) -> list[pygame.Surface]:
+        """
+        All frames flipped on the horizontal axis (creates the missing ones)
+        """
+        self.warm_up()
+        return self._frames_flipX
+
+    def from_surface(self,surface:pygame.Surface,frame_size : Tuple[int,int],eager_flip:bool=False)->Self:
         """
         Loads frames from a spritesheet containing all animation frames aligned horizontally, left to right
-        Frames are cut and stored in 2 versions, original and flipped on the horizontal axis.
-        Flipping sprites being pretty common, this serves as a builtin cache.
+        Frames flipped on the horizontal axis are created the first time they are requested and then cached.
+        Use eager_flip (or warm_up) to create them all right away.
         """
         self.frames : List[pygame.Surface] = list(
             bf.utils.split_surface(surface, frame_size).values()
         )
-        self.frames_flipX : List[pygame.Surface] = list(
-            bf.utils.split_surface(
-                surface, frame_size,
-                func=lambda s : pygame.transform.flip(s,True,False)
-            ).values()
-        )
-        self.duration_list_length = len(self.frames)
-        self.numFrames = self.duration_list_length
-        if not self.duration_list:
-            self.duration_list = [1]*self.duration_list_length
+        self._frames_flipX = [None] * len(self.frames)
+        if eager_flip:
+            self.warm_up()
+        self.numFrames = len(self.frames)
+        if len(self.duration_list) != self.numFrames:
+            self.duration_list = [1]*self.numFrames
+        self._build_frame_table()
         return self
 
     def from_path(
@@ -66,26 +72,45 @@ class Animation:
         surface = bf.ResourceManager().get_image(path, convert_alpha)
         return self.from_surface(surface, frame_size)
 
+    def warm_up(self) -> Self:
+        """
+        Creates all flipped frames that were not requested yet
+        """
+        for i in range(len(self.frames)):
+            self.get_flipped_frame(i)
+        return self
+
+    def get_flipped_frame(self, index: int) -> pygame.Surface:
+        surface = self._frames_flipX[index]
+        if surface is None:
+            surface = pygame.transform.flip(self.frames[index], True, False)
+            self._frames_flipX[index] = surface
+        return surface
+
 
     def __repr__(self):
         return f"Animation({self.name})"
 
+    def _build_frame_table(self) -> None:
+        self.frame_table = [
+            index for index, duration in enumerate(self.duration_list) for _ in range(duration)
+        ]
+        self.duration_list_length = len(self.frame_table)
+
     def counter_to_frame(self, counter: Union[float, int]) -> int:
         if not self.frames : 
             raise ValueError("Animation has no frames")
-        return search_index(
-            int(counter % self.duration_list_length), self.duration_list
-        )
+        return self.frame_table[int(counter) % self.duration_list_length]
 
     def get_frame(self, counter: Union[float, int], flip: bool) -> pygame.Surface:
         i = self.counter_to_frame(counter)
-        return self.frames_flipX[i] if flip else self.frames[i]
+        return self.get_flipped_frame(i) if flip else self.frames[i]
 
     def set_duration_list(self, duration_list: Union[List[int], int]) -> Self:
         if not isinstance(duration_list, Iterable):
             duration_list = [duration_list] * len(self.frames)
         if len(duration_list) != self.numFrames:
             raise ValueError("duration_list should have values for all frames")
-        self.duration_list = duration_list
-        self.duration_list_length = sum(self.duration_list)
+        self.duration_list = list(duration_list)
+        self._build_frame_table()
         return self
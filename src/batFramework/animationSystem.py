@@ -0,0 +1,86 @@
+import heapq
+import batFramework as bf
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .animatedSprite import AnimatedSprite
+
+
+class AnimationSystem:
+    """
+    Advances all registered AnimatedSprites in a single pass.
+    Every sprite shares the same clock (in frames at 60fps), a sprite only stores the
+    clock value at which its current cycle started.
+    Cycle ends are kept in a heap ordered by the clock value at which they happen,
+    so an update only touches the sprites whose cycle actually ended this frame.
+    Each SceneLayer owns one and updates it before its entities.
+    """
+
+    def __init__(self) -> None:
+        self.clock: float = 0.0
+        self._sprites: dict[int, "AnimatedSprite"] = {}  # key is uid
+        self._schedule: list[tuple[float, int, int, "AnimatedSprite"]] = []  # (end, seq, version, sprite)
+        self._seq: int = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def __contains__(self, sprite: "AnimatedSprite") -> bool:
+        return sprite.uid in self._sprites
+
+    def register(self, sprite: "AnimatedSprite", counter: float = 0.0) -> None:
+        """
+        Adds the sprite to the system, keeping its animation at the given counter value
+        """
+        self._sprites[sprite.uid] = sprite
+        sprite._cycle_start = self.clock - counter
+        self.schedule(sprite)
+
+    def unregister(self, sprite: "AnimatedSprite") -> None:
+        if self._sprites.pop(sprite.uid, None) is None:
+            return
+        # invalidates pending heap entries of the sprite
+        sprite._cycle_version += 1
+
+    def get_counter(self, sprite: "AnimatedSprite") -> float:
+        return self.clock - sprite._cycle_start
+
+    def set_counter(self, sprite: "AnimatedSprite", counter: float) -> None:
+        sprite._cycle_start = self.clock - counter
+        self.schedule(sprite)
+
+    def schedule(self, sprite: "AnimatedSprite") -> None:
+        """
+        (Re)computes when the current cycle of the sprite ends.
+        Must be called whenever the animation or counter of the sprite changes
+        """
+        sprite._cycle_version += 1
+        if not sprite.current_animation:
+            return
+        length = sprite.animations[sprite.current_animation].duration_list_length
+        if length <= 0:
+            return
+        self._seq += 1
+        heapq.heappush(
+            self._schedule,
+            (sprite._cycle_start + length, self._seq, sprite._cycle_version, sprite),
+        )
+        # drop stale entries if animations are changed a lot more often than they end
+        if len(self._schedule) > 2 * len(self._sprites) + 64:
+            self._compact()
+
+    def _compact(self) -> None:
+        self._schedule = [
+            entry for entry in self._schedule
+            if entry[2] == entry[3]._cycle_version and entry[3].uid in self._sprites
+        ]
+        heapq.heapify(self._schedule)
+
+    def update(self, dt: float) -> None:
+        self.clock += dt * 60
+        schedule = self._schedule
+        while schedule and schedule[0][0] <= self.clock:
+            _, _, version, sprite = heapq.heappop(schedule)
+            if version != sprite._cycle_version or sprite.animation_system is not self:
+                continue
+            sprite._end_cycle()
@@ -1,11 +1,41 @@
+import io
+import queue
+import random
+import threading
 import pygame
 import batFramework as bf
 
 class AudioManager(metaclass=bf.Singleton):
+    """
+    Sounds are loaded with a policy (see bf.loadPolicy) : eager sounds are decoded right away,
+    lazy ones on their first play_sound, streamed ones are played through the music stream
+    (one at a time, replacing the current music).
+    Decoded sounds are accounted in bytes of PCM. With a memory budget set, the least recently
+    played non persistent sounds are released (and decoded again when needed) to stay under it.
+    Sounds played without a named channel get a voice from a pool of mixer channels :
+    a sound can be limited to a number of simultaneous instances (its oldest one is replaced),
+    when no voice is free the oldest voice of lowest priority is stolen if its priority is not higher,
+    and a sound is only started once per frame (update is called by the Manager each frame).
+    """
     def __init__(self) -> None:
         self._sounds: dict[str, dict] = {}
+        self._memory_usage: int = 0  # bytes of decoded sounds
+        self._memory_budget: int | None = None
+        self._use_count: int = 0  # incremented on each play, for eviction order
+        self._streamed_sound: str | None = None
+        self.stream_threshold: int = 2_000_000  # file size (bytes) above which load_resources streams sounds
         self._musics: dict[str, str] = {}
         self._current_music: str | None = None
+        self._music_data: dict[str, tuple[bytes | None, pygame.mixer.Sound | None]] = {}  # path -> prefetched file
+        self._prefetch_threads: dict[str, threading.Thread] = {}
+        self._prefetched: queue.SimpleQueue = queue.SimpleQueue()  # (path, data, sound) read by the threads, collected on the main thread
+        self.music_cache_size: int = 3  # prefetched music files kept in memory
+        self._pending_music: tuple | None = None  # music change waiting for its file
+        self._queued_music: list[tuple[str, int]] = []  # waiting for their file before mixer.music.queue
+        self._music_queue: list[str] = []  # queued in the mixer, in order
+        self._music_channels: list[pygame.mixer.Channel] = []  # used by crossfades
+        self._music_channel: int = 0
+        self._playlist: Playlist | None = None
         self._music_volume: float = 1.0
         self._sound_volume: float = 1.0
 
@@ -13,6 +43,10 @@ class AudioManager(metaclass=bf.Singleton):
         self._channel_volumes: dict[str, float] = {}
         self._use_custom_channels: bool = False
 
+        self._voice_pool: list[pygame.mixer.Channel] | None = None  # built on first use
+        self._voices: dict[int, tuple[int, int, str]] = {}  # channel id -> (priority, start order, sound name)
+        self._played_this_frame: set[str] = set()
+
         pygame.mixer.music.set_endevent(bf.const.MUSIC_END_EVENT)
 
     # --- Channel management ---
@@ -21,12 +55,82 @@ class AudioManager(metaclass=bf.Singleton):
         Setup channels by providing a dict of {channel_name: channel_index}.
         Enables custom channel management.
         """
-        pygame.mixer.set_num_channels(max(channels.values()) + 1)
+        pygame.mixer.set_num_channels(max(max(channels.values()) + 1, pygame.mixer.get_num_channels()))
         self._channels = {
             name: pygame.mixer.Channel(idx) for name, idx in channels.items()
         }
         self._channel_volumes = {name: 1.0 for name in channels.keys()}
         self._use_custom_channels = True
+        self._voice_pool = None
+
+    # --- Voice management ---
+    def set_voice_pool(self, size: int) -> None:
+        """
+        Sets the number of mixer channels used to play sounds without a named channel
+        (can be more if reserved channels have higher indices)
+        """
+        custom = {c.id for c in (*self._channels.values(), *self._music_channels)}
+        needed = size + len(custom)
+        if custom:
+            needed = max(needed, max(custom) + 1)
+        pygame.mixer.set_num_channels(needed)
+        self._voice_pool = None
+        self._voices.clear()
+
+    def _get_voice_pool(self) -> list[pygame.mixer.Channel]:
+        if self._voice_pool is None:
+            custom = {c.id for c in (*self._channels.values(), *self._music_channels)}
+            self._voice_pool = [
+                pygame.mixer.Channel(i) for i in range(pygame.mixer.get_num_channels()) if i not in custom
+            ]
+        return self._voice_pool
+
+    def set_sound_limits(self, name: str, max_instances: int = 0, priority: int = 0) -> None:
+        """
+        max_instances : max simultaneous plays of the sound (0 for no limit)
+        priority : sounds of higher priority steal voices of lower ones when the pool is full
+        """
+        sound_data = self._sounds.get(name)
+        if not sound_data:
+            print(f"[AudioManager] Sound '{name}' not loaded.")
+            return
+        sound_data["max_instances"] = max_instances
+        sound_data["priority"] = priority
+
+    def _get_voice(self, name: str, sound: pygame.mixer.Sound, sound_data: dict) -> pygame.mixer.Channel | None:
+        pool = self._get_voice_pool()
+        priority = sound_data["priority"]
+        max_instances = sound_data["max_instances"]
+        voices = self._voices
+        # replace the oldest instance of the sound if it reached its limit
+        if max_instances and sound.get_num_channels() >= max_instances:
+            instances = [
+                (voices[c.id][1], i) for i, c in enumerate(pool)
+                if c.get_busy() and c.get_sound() is sound and c.id in voices
+            ]
+            if instances:
+                return pool[min(instances)[1]]
+        for channel in pool:
+            if not channel.get_busy():
+                return channel
+        # steal the oldest voice of lowest priority
+        victim = None
+        for i, channel in enumerate(pool):
+            voice = voices.get(channel.id)
+            if voice is None:
+                continue
+            if voice[0] <= priority and (victim is None or voice[:2] < victim[0]):
+                victim = (voice[:2], i)
+        return pool[victim[1]] if victim is not None else None
+
+    def update(self, dt: float = 0) -> None:
+        """
+        Starts a new frame for sound deduplication, starts music changes whose file is ready
+        """
+        self._played_this_frame.clear()
+        self._collect_prefetched()
+        if self._pending_music is not None or self._queued_music:
+            self._process_pending_music()
 
     def set_channel_volume(self, channel_name: str, volume: float) -> None:
         if channel_name in self._channels:
@@ -37,30 +141,132 @@ class AudioManager(metaclass=bf.Singleton):
     def get_channel_volume(self, channel_name: str) -> float:
         return self._channel_volumes.get(channel_name, 1.0)
 
+    # --- Memory management ---
+    @staticmethod
+    def get_sound_bytes(sound: pygame.mixer.Sound) -> int:
+        """
+        Size of the decoded PCM data of the sound
+        """
+        init = pygame.mixer.get_init()
+        if not init:
+            return 0
+        frequency, size, channels = init
+        return int(sound.get_length() * frequency) * channels * (abs(size) // 8)
+
+    def set_memory_budget(self, budget: int | None) -> None:
+        """
+        Max bytes of decoded sounds (None for no limit). Persistent and playing sounds are never released
+        """
+        self._memory_budget = budget
+        self._evict()
+
+    def get_memory_budget(self) -> int | None:
+        return self._memory_budget
+
+    def get_memory_usage(self) -> int:
+        return self._memory_usage
+
+    def _decode(self, name: str, sound_data: dict) -> pygame.mixer.Sound | None:
+        try:
+            sound = pygame.mixer.Sound(sound_data["path"])
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"[AudioManager] Failed to load sound '{name}': {e}")
+            return None
+        sound_data["sound"] = sound
+        sound_data["bytes"] = self.get_sound_bytes(sound)
+        self._memory_usage += sound_data["bytes"]
+        self._evict(keep=name)
+        return sound
+
+    def _release(self, sound_data: dict) -> None:
+        if sound_data["sound"] is None:
+            return
+        self._memory_usage -= sound_data["bytes"]
+        sound_data["sound"] = None
+        sound_data["bytes"] = 0
+
+    def _evict(self, keep: str | None = None) -> None:
+        """
+        Releases least recently played sounds until the memory usage fits in the budget
+        """
+        if self._memory_budget is None or self._memory_usage <= self._memory_budget:
+            return
+        candidates = sorted(
+            (
+                (data["last_used"], name) for name, data in self._sounds.items()
+                if data["sound"] is not None and not data["persistent"] and name != keep
+                and data["sound"].get_num_channels() == 0
+            ),
+        )
+        for _, name in candidates:
+            if self._memory_usage <= self._memory_budget:
+                break
+            self._release(self._sounds[name])
+
+    def release_sound(self, name: str) -> None:
+        """
+        Frees the decoded data of a sound, it will be decoded again on its next play
+        """
+        if name in self._sounds:
+            self._release(self._sounds[name])
+
     # --- Sound management ---
-    def load_sound(self, name: str, path: str, persistent: bool = False) -> pygame.mixer.Sound:
+    def load_sound(
+        self, name: str, path: str, persistent: bool = False, policy: bf.loadPolicy = bf.loadPolicy.EAGER
+    ) -> pygame.mixer.Sound | None:
+        """
+        Registers a sound. Returns the decoded sound (None if lazy, streamed or not decoded yet)
+        """
         if name in self._sounds:
             return self._sounds[name]["sound"]
-        path = bf.ResourceManager().get_path(path)
-        sound = pygame.mixer.Sound(path)
-        self._sounds[name] = {
-            "sound": sound,
-            "path": path,
+        sound_data = {
+            "sound": None,
+            "path": bf.ResourceManager().get_path(path),
             "persistent": persistent,
+            "policy": policy,
+            "bytes": 0,
+            "last_used": self._use_count,
+            "max_instances": 0,
+            "priority": 0,
         }
-        return sound
+        self._sounds[name] = sound_data
+        if policy == bf.loadPolicy.EAGER:
+            return self._decode(name, sound_data)
+        return None
 
-    def load_sounds(self, sounds_data: list[tuple[str, str, bool]]) -> None:
-        for name, path, persistent in sounds_data:
-            self.load_sound(name, path, persistent)
+    def load_sounds(self, sounds_data: list[tuple]) -> None:
+        """
+        Tuples of (name, path, persistent) or (name, path, persistent, policy)
+        """
+        for name, path, persistent, *policy in sounds_data:
+            self.load_sound(name, path, persistent, *policy)
+
+    def get_sound(self, name: str) -> pygame.mixer.Sound | None:
+        """
+        Returns the decoded sound, decoding it if needed (None if unknown or streamed)
+        """
+        sound_data = self._sounds.get(name)
+        if not sound_data or sound_data["policy"] == bf.loadPolicy.STREAMED:
+            return None
+        if sound_data["sound"] is None:
+            return self._decode(name, sound_data)
+        return sound_data["sound"]
 
     def play_sound(self, name: str, volume: float = 1.0, channel_name: str | None = None) -> bool:
         sound_data = self._sounds.get(name)
         if not sound_data:
             print(f"[AudioManager] Sound '{name}' not loaded.")
             return False
-        sound = sound_data["sound"]
+        self._use_count += 1
+        sound_data["last_used"] = self._use_count
         volume = max(0.0, min(volume, 1.0)) * self._sound_volume
+        if sound_data["policy"] == bf.loadPolicy.STREAMED:
+            return self._play_streamed(name, sound_data["path"], volume)
+        sound = sound_data["sound"]
+        if sound is None:
+            sound = self._decode(name, sound_data)
+        if sound is None:
+            return False
 
         if self._use_custom_channels and channel_name:
             channel = self._channels.get(channel_name)
@@ -72,9 +278,28 @@ class AudioManager(metaclass=bf.Singleton):
             channel.set_volume(volume * self._channel_volumes.get(channel_name, 1.0))
             channel.play(sound)
         else:
-            # Default pygame behavior: auto assign a free channel
-            sound.set_volume(volume)
-            sound.play()
+            if name in self._played_this_frame:
+                return True  # already started this frame
+            channel = self._get_voice(name, sound, sound_data)
+            if channel is None:
+                return False  # every voice is busy with more important sounds
+            channel.stop()
+            channel.set_volume(volume)
+            channel.play(sound)
+            self._voices[channel.id] = (sound_data["priority"], self._use_count, name)
+            self._played_this_frame.add(name)
+        return True
+
+    def _play_streamed(self, name: str, path: str, volume: float) -> bool:
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play()
+        except pygame.error as e:
+            print(f"[AudioManager] Failed to stream sound '{name}': {e}")
+            return False
+        self._current_music = None
+        self._streamed_sound = name
         return True
 
     def stop_sound(self, name: str) -> bool:
@@ -82,10 +307,17 @@ class AudioManager(metaclass=bf.Singleton):
         if not sound_data:
             print(f"[AudioManager] Sound '{name}' not loaded.")
             return False
-        sound_data["sound"].stop()
+        if self._streamed_sound == name:
+            pygame.mixer.music.stop()
+            self._streamed_sound = None
+        elif sound_data["sound"] is not None:
+            sound_data["sound"].stop()
         return True
 
     def free_sounds(self, force: bool = False) -> None:
+        for data in self._sounds.values():
+            if force or not data["persistent"]:
+                self._release(data)
         if force:
             self._sounds.clear()
         else:
@@ -107,50 +339,292 @@ class AudioManager(metaclass=bf.Singleton):
         for name, path in musics_data:
             self.load_music(name, path)
 
-    def play_music(self, name: str, loops: int = 0, fade_ms: int = 500) -> bool:
+    def _read_music(self, path: str, decode: bool) -> None:
+        # runs in a background thread : only publishes its result
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            sound = pygame.mixer.Sound(file=io.BytesIO(data)) if decode else None
+            self._prefetched.put((path, data, sound))
+        except (OSError, pygame.error) as e:
+            self._prefetched.put((path, None, None))
+            print(f"[AudioManager] Failed to read music '{path}': {e}")
+
+    def _collect_prefetched(self) -> None:
+        """
+        Moves the files read by the prefetch threads to the cache, then keeps the most recent ones only.
+        Files waiting to be played or queued are never evicted
+        """
+        if self._prefetched.empty():
+            return
+        while not self._prefetched.empty():
+            path, data, sound = self._prefetched.get_nowait()
+            self._music_data.pop(path, None)
+            self._music_data[path] = (data, sound)  # most recently used
+        waiting = {self._musics.get(name) for name, _ in self._queued_music}
+        if self._pending_music is not None:
+            waiting.add(self._musics.get(self._pending_music[1]))
+        evictable = [p for p in self._music_data if p not in waiting]
+        for oldest in evictable[:max(0, len(self._music_data) - self.music_cache_size)]:
+            del self._music_data[oldest]
+
+    def prefetch_music(self, name: str, decode: bool = False) -> bool:
+        """
+        Reads the music file in a background thread so playing it doesn't touch the disk.
+        decode also decodes it for crossfade_music
+        """
         path = self._musics.get(name)
         if not path:
             print(f"[AudioManager] Music '{name}' not loaded.")
             return False
+        self._collect_prefetched()
+        cached = self._music_data.get(path)
+        if cached is not None and (cached[1] is not None or not decode or cached[0] is None):
+            return True
+        thread = self._prefetch_threads.get(path)
+        if thread is not None and thread.is_alive():
+            return True
+        self._prefetch_threads = {p: t for p, t in self._prefetch_threads.items() if t.is_alive()}
+        thread = threading.Thread(target=self._read_music, args=(path, decode), daemon=True)
+        self._prefetch_threads[path] = thread
+        thread.start()
+        return True
+
+    def is_music_ready(self, name: str, decoded: bool = False) -> bool:
+        self._collect_prefetched()
+        cached = self._music_data.get(self._musics.get(name))
+        return cached is not None and (not decoded or cached[1] is not None or cached[0] is None)
+
+    def _music_file(self, path: str):
+        cached = self._music_data.pop(path, None)
+        if cached is None or cached[0] is None:
+            return None
+        self._music_data[path] = cached  # most recently used
+        return io.BytesIO(cached[0])
+
+    def _get_music_channels(self) -> list[pygame.mixer.Channel]:
+        if not self._music_channels:
+            count = pygame.mixer.get_num_channels()
+            pygame.mixer.set_num_channels(count + 2)
+            self._music_channels = [pygame.mixer.Channel(count), pygame.mixer.Channel(count + 1)]
+            self._voice_pool = None
+        return self._music_channels
+
+    def _stop_crossfade(self, fade_ms: int = 0) -> None:
+        for channel in self._music_channels:
+            if fade_ms:
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+
+    def play_music(self, name: str, loops: int = 0, fade_ms: int = 500) -> bool:
+        """
+        Plays the music once its file is read (in the background if not prefetched),
+        the change happens in a later update if needed
+        """
+        if not self.prefetch_music(name):
+            return False
+        self._pending_music = ("play", name, loops, fade_ms)
+        self._current_music = name
+        self._streamed_sound = None
+        self._process_pending_music()
+        return True
+
+    def queue_music(self, name: str, loops: int = 0) -> bool:
+        """
+        Queues the music to start right when the current one ends (gapless)
+        """
+        if not self.prefetch_music(name):
+            return False
+        self._queued_music.append((name, loops))
+        self._process_pending_music()
+        return True
+
+    def crossfade_music(self, name: str, fade_ms: int = 1000, loops: int = -1) -> bool:
+        """
+        Fades the current music out while the new one fades in.
+        The new music is decoded in the background and played on a dedicated channel
+        """
+        if not self.prefetch_music(name, decode=True):
+            return False
+        self._pending_music = ("crossfade", name, loops, fade_ms)
+        self._queued_music.clear()
+        self._current_music = name
+        self._streamed_sound = None
+        self._process_pending_music()
+        return True
+
+    def _process_pending_music(self) -> None:
+        if self._pending_music is not None:
+            kind, name, loops, fade_ms = self._pending_music
+            if not self.is_music_ready(name, decoded=kind == "crossfade"):
+                return
+            self._pending_music = None
+            if kind == "play":
+                self._start_music(name, loops, fade_ms)
+            else:
+                self._start_crossfade(name, loops, fade_ms)
+
+        while self._queued_music and self.is_music_ready(self._queued_music[0][0]):
+            name, loops = self._queued_music.pop(0)
+            path = self._musics[name]
+            file = self._music_file(path)
+            if file is None:
+                continue
+            try:
+                pygame.mixer.music.queue(file, namehint=path, loops=loops)
+                self._music_queue.append(name)
+            except pygame.error as e:
+                print(f"[AudioManager] Failed to queue music '{name}': {e}")
+
+    def _start_music(self, name: str, loops: int, fade_ms: int) -> None:
+        path = self._musics[name]
+        file = self._music_file(path)
+        if file is None:
+            self._current_music = None
+            return
         try:
-            pygame.mixer.music.load(path)
+            self._stop_crossfade(fade_ms)
+            pygame.mixer.music.load(file, namehint=path)
             pygame.mixer.music.set_volume(self._music_volume)
             pygame.mixer.music.play(loops=loops, fade_ms=fade_ms)
-            self._current_music = name
-            return True
+            self._music_queue.clear()
         except pygame.error as e:
             print(f"[AudioManager] Failed to play music '{name}': {e}")
+            self._current_music = None
+
+    def _start_crossfade(self, name: str, loops: int, fade_ms: int) -> None:
+        sound = self._music_data.get(self._musics[name], (None, None))[1]
+        if sound is None:
+            self._current_music = None
+            return
+        channels = self._get_music_channels()
+        old, new = channels[self._music_channel], channels[1 - self._music_channel]
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms)
+        old.fadeout(fade_ms)
+        new.set_volume(self._music_volume)
+        new.play(sound, loops=loops, fade_ms=fade_ms)
+        self._music_channel = 1 - self._music_channel
+        self._music_queue.clear()
+
+    def play_playlist(self, playlist: "Playlist", fade_ms: int = 500) -> bool:
+        """
+        Plays the tracks of the playlist one after the other, each next track is
+        prefetched and queued while the previous one plays
+        """
+        self._playlist = playlist
+        name = playlist.current()
+        if name is None:
             return False
+        if not self.play_music(name, fade_ms=fade_ms):
+            return False
+        self._queue_playlist_next()
+        return True
+
+    def _queue_playlist_next(self) -> None:
+        next_name = self._playlist.peek_next()
+        if next_name is not None:
+            self.queue_music(next_name)
+
+    def on_music_end(self) -> None:
+        """
+        Called by the Manager when the music stream reaches the end of a track
+        """
+        if self._music_queue:
+            self._current_music = self._music_queue.pop(0)
+        elif not pygame.mixer.music.get_busy() and not any(c.get_busy() for c in self._music_channels):
+            self._current_music = None
+        if self._playlist is not None and self._current_music is not None:
+            self._playlist.advance()
+            self._queue_playlist_next()
 
     def stop_music(self) -> None:
+        self._pending_music = None
+        self._queued_music.clear()
+        self._music_queue.clear()
+        self._playlist = None
         if self._current_music:
             pygame.mixer.music.stop()
+            self._stop_crossfade()
             self._current_music = None
 
     def fadeout_music(self, fade_ms: int) -> None:
+        self._pending_music = None
+        self._queued_music.clear()
+        self._music_queue.clear()
+        self._playlist = None
         if self._current_music:
             pygame.mixer.music.fadeout(fade_ms)
+            self._stop_crossfade(fade_ms)
             self._current_music = None
 
     def pause_music(self) -> None:
         if self._current_music:
             pygame.mixer.music.pause()
+            for channel in self._music_channels:
+                channel.pause()
 
     def resume_music(self) -> None:
         if self._current_music:
             pygame.mixer.music.unpause()
+            for channel in self._music_channels:
+                channel.unpause()
 
     def free_music(self) -> None:
         if self._current_music:
             pygame.mixer.music.unload()
+            self._stop_crossfade()
             self._current_music = None
+        self._music_data.clear()
 
     def set_music_volume(self, volume: float) -> None:
         self._music_volume = max(0.0, min(volume, 1.0))
         pygame.mixer.music.set_volume(self._music_volume)
+        for channel in self._music_channels:
+            channel.set_volume(self._music_volume)
 
     def get_music_volume(self) -> float:
         return self._music_volume
 
     def get_current_music(self) -> str | None:
         return self._current_music
+
+
+class Playlist:
+    """
+    Ordered list of music names, played by AudioManager.play_playlist
+    """
+
+    def __init__(self, *names: str, loop: bool = True, shuffle: bool = False) -> None:
+        self.names: list[str] = list(names)
+        self.loop = loop
+        self.shuffle = shuffle
+        self.index: int = 0
+        if shuffle:
+            random.shuffle(self.names)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def current(self) -> str | None:
+        return self.names[self.index] if self.index < len(self.names) else None
+
+    def peek_next(self) -> str | None:
+        index = self.index + 1
+        if index >= len(self.names):
+            if not self.loop or not self.names:
+                return None
+            index = 0
+        return self.names[index]
+
+    def advance(self) -> str | None:
+        self.index += 1
+        if self.index >= len(self.names) and self.loop and self.names:
+            self.index = 0
+            if self.shuffle and len(self.names) > 1:
+                last = self.names[-1]
+                random.shuffle(self.names)
+                if self.names[0] == last:  # don't play the same track twice in a row
+                    self.names.append(self.names.pop(0))
+        return self.current()
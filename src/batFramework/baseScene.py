@@ -128,6 +128,10 @@ class BaseScene:
         """Get entities by their tags."""
         return itertools.chain.from_iterable(l.get_by_tags(*tags) for l in self.scene_layers)
 
+    def get_by_any_tags(self, *tags):
+        """Get entities having at least one of the given tags."""
+        return itertools.chain.from_iterable(l.get_by_any_tags(*tags) for l in self.scene_layers)
+
     def get_by_uid(self, uid) -> bf.Entity | None:
         """Get an entity by its unique identifier."""
         for l in self.scene_layers:
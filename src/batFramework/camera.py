@@ -37,7 +37,7 @@ class Camera:
         self.zoom(1,force=True)
 
     def get_mouse_pos(self) -> tuple[float, float]:
-        return self.screen_to_world(pygame.mouse.get_pos())
+        return self.screen_to_world(bf.InputState().get_mouse_pos())
 
     def set_clear_color(self, color: pygame.Color | tuple | str) -> Self:
         self._clear_color = color
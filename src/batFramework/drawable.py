@@ -26,6 +26,7 @@ class Drawable(Entity):
         self.surface_flags: int = surface_flags
         self.blit_flags: int = 0
         self.drawn_by_group : bool = False # flag for render group  
+        self.render_group : bf.RenderGroup | None = None
         self.surface: pygame.Surface = pygame.Surface(self.rect.size, surface_flags)
         if convert_alpha:
             self.surface = self.surface.convert_alpha()
@@ -58,12 +59,38 @@ class Drawable(Entity):
         self.render_order = render_order
         if self.parent_layer:
             self.parent_layer.update_draw_order()
+        if self.render_group:
+            self.render_group.refresh_member(self)
         return self
 
     def set_visible(self, value: bool) -> Self:
         self.visible = value
+        if self.render_group:
+            self.render_group.refresh_member(self)
         return self
 
+    def set_position(self, x, y) -> Self:
+        super().set_position(x, y)
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def set_center(self, x, y) -> Self:
+        super().set_center(x, y)
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def _set_render_group(self, group: "bf.RenderGroup | None") -> None:
+        self.render_group = group
+        self.drawn_by_group = group is not None
+
+    def set_parent_scene(self, scene) -> Self:
+        # entities removed from their scene leave their render group
+        if scene is None and self.parent_scene is not None and self.render_group:
+            self.render_group.remove(self)
+        return super().set_parent_scene(scene)
+
     def get_mask(self)->pygame.Mask:
         return pygame.mask.from_surface(self.surface)
 
@@ -91,7 +118,8 @@ class Drawable(Entity):
         if self.convert_alpha:
             self.surface = self.surface.convert_alpha()
         self.surface.fill((0, 0, 0, 0 if self.convert_alpha else 255))
-
+        if self.render_group:
+            self.render_group.refresh_member(self)
         return self
 
     def draw(self, camera: bf.Camera) -> None:
@@ -1,11 +1,17 @@
 import pygame
 import batFramework as bf
-from functools import lru_cache
+from array import array
 from typing import Callable,Any
 
+EASING_TABLE_RESOLUTION = 256  # samples per curve, values in between are interpolated
+_MAX_EASING_TABLES = 64
+_easing_tables: dict[tuple, array] = {}
+
 
-@lru_cache(maxsize=None)
 def process_value(progress: float, p0: float, p1: float, p2: float, p3: float) -> float:
+    """
+    Exact value of the easing curve at progress (see ease for the fast version)
+    """
     if p0 == 0 and p1 == 0 and p2 == 1 and p3 == 1:  # Linear easing control points
         return progress
     t = progress
@@ -16,6 +22,37 @@ def process_value(progress: float, p0: float, p1: float, p2: float, p3: float) -
     return 3 * t_inv2 * t * p1 + 3 * t_inv * t2 * p3 + t3
 
 
+def get_easing_table(control_points: tuple) -> array:
+    """
+    Returns the curve sampled at EASING_TABLE_RESOLUTION + 1 regular steps (built once per curve)
+    """
+    table = _easing_tables.get(control_points)
+    if table is None:
+        if len(_easing_tables) >= _MAX_EASING_TABLES:  # custom curves : drop the oldest
+            del _easing_tables[next(iter(_easing_tables))]
+        n = EASING_TABLE_RESOLUTION
+        table = array("d", (process_value(i / n, *control_points) for i in range(n + 1)))
+        _easing_tables[control_points] = table
+    return table
+
+
+def ease(progress: float, easing: bf.easing) -> float:
+    """
+    Value of the easing curve at progress, from its lookup table
+    """
+    if easing == bf.easing.LINEAR:
+        return progress
+    if progress <= 0:
+        return 0.0
+    if progress >= 1:
+        return 1.0
+    table = get_easing_table(easing.control_points)
+    x = progress * EASING_TABLE_RESOLUTION
+    i = int(x)
+    a = table[i]
+    return a + (table[i + 1] - a) * (x - i)
+
+
 class EasingController(bf.Timer):
     def __init__(
         self,
@@ -47,7 +84,7 @@ class EasingController(bf.Timer):
         if self.easing_function == bf.easing.LINEAR: # avoid calculating if linear (just use progression as is)
             self.value = self.get_progression()
         else:
-            self.value = process_value(self.get_progression(), *self.easing_function.control_points)
+            self.value = ease(self.get_progression(), self.easing_function)
         
         if self.update_callback:
             self.update_callback(self.value)
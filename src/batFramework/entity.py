@@ -10,20 +10,28 @@ if TYPE_CHECKING:
 class Entity:
     _count: int = 0
     _available_uids: set[int] = set()
+    event_types: tuple[int, ...] = ()  # event types given by the layer's InputRouter (empty means all)
 
     def __init__(self,*args,**kwargs) -> None:
-        if Entity._available_uids:
-            self.uid = Entity._available_uids.pop()
-        else:
-            self.uid = Entity._count
-            Entity._count += 1
+        self.uid = Entity.new_uid()
         size = kwargs.get("size",(10,10))
         self.rect = pygame.FRect(0, 0, *size)
-        self.tags: list[str] = []
+        self.tags: set[str] = set()
         self.parent_scene: bf.Scene | None = None
         self.parent_layer: bf.SceneLayer | None = None
         self.debug_color: tuple | str = "red"
 
+    @staticmethod
+    def new_uid() -> int:
+        """
+        Returns an unused uid, shared by all kinds of entities
+        """
+        if Entity._available_uids:
+            return Entity._available_uids.pop()
+        uid = Entity._count
+        Entity._count += 1
+        return uid
+
     def __del__(self):
         try:
             Entity._available_uids.add(self.uid)
@@ -71,29 +79,34 @@ class Entity:
         pass
 
     def add_tags(self, *tags) -> Self:
-        for tag in tags:
-            if tag not in self.tags:
-                self.tags.append(tag)
-        self.tags.sort()
+        new_tags = set(tags).difference(self.tags)
+        if new_tags:
+            self.tags.update(new_tags)
+            if self.parent_layer:
+                self.parent_layer.index_tags(self, new_tags)
         return self
 
     def remove_tags(self, *tags):
-        self.tags = [tag for tag in self.tags if tag not in tags]
+        old_tags = self.tags.intersection(tags)
+        if old_tags:
+            self.tags.difference_update(old_tags)
+            if self.parent_layer:
+                self.parent_layer.unindex_tags(self, old_tags)
 
     def has_tags(self, *tags) -> bool:
         """
         return True if entity contains all given tags
         """
-        return all(tag in self.tags for tag in tags)
+        return self.tags.issuperset(tags)
 
     def has_any_tags(self, *tags) -> bool:
         """
         return True if entity contains any of given tags
         """
-        return any(tag in self.tags for tag in tags)
+        return not self.tags.isdisjoint(tags)
 
     def get_tags(self) -> list[str]:
-        return self.tags
+        return sorted(self.tags)
 
     def process_event(self, event: pygame.Event) -> None:
         if event.consumed:
@@ -169,3 +169,9 @@ class textMode(Enum):
 
 
 
+
+
+class loadPolicy(Enum):
+    EAGER = 0  # decoded when loaded
+    LAZY = 1  # decoded the first time it is played
+    STREAMED = 2  # never decoded, played through the music stream
@@ -12,6 +12,7 @@ from .textWidget import TextWidget
 from .label import Label
 from .tooltip import ToolTip
 from .animatedLabel import AnimatedLabel
+from .textBuffer import TextBuffer
 from .textInput import TextInput
 from .button import Button
 from .debugger import *
@@ -1,6 +1,7 @@
 from .label import Label
 import batFramework as bf
 from typing import Self,Callable,Any
+from bisect import bisect_left
 
 
 class AnimatedLabel(Label):
@@ -11,6 +12,11 @@ class AnimatedLabel(Label):
         self.is_paused: bool = False
         self.original_text = ""
         self.end_callback : Callable[[],Any]= None
+        # line breaks of original_text, computed again when the text, width or font changes
+        self._layout: list[tuple[int, int]] = []
+        self._layout_starts: list[int] = []
+        self._layout_key = None
+        self._revealed_lines: tuple[int, str] = (0, "")  # (count, joined text) of the fully revealed lines
         self.set_autoresize(False)
         self.set_alignment(bf.alignment.LEFT)
         super().__init__("")
@@ -35,30 +41,77 @@ class AnimatedLabel(Label):
         return self
 
     def cut_text_to_width(self, text: str) -> list[str]:
+        """
+        Returns the lines of text once wrapped to the inner width
+        """
+        return [text[start:end] for start, end in self._wrap(text)]
+
+    def _wrap(self, text: str) -> list[tuple[int, int]]:
+        """
+        Returns the (start, end) indices of each line of text once wrapped to the inner width.
+        Lines break at the last space before the width is exceeded, measured from cumulative glyph advances.
+        While the width follows the text (autoresize), only newlines break lines
+        """
         w = self.get_inner_width()
-        if text == "" or not self.text_widget.font_object or w < self.text_widget.font_object.point_size:
-            return [text]
-        left = 0
         font_object = self.text_widget.font_object
-        for index in range(len(text)):
-            width = font_object.size(text[left:index])[0]
-
-            if width > w:
-                cut_point_start = index - 1
-                cut_point_end = index - 1
-                last_space = text.rfind(" ", 0, cut_point_start)
-                last_nline = text.rfind("\n", 0, cut_point_start)
+        if text == "" or not font_object:
+            return [(0, len(text))]
+        if self.autoresize_w or w < font_object.point_size:
+            res, start = [], 0
+            for paragraph in text.split("\n"):
+                res.append((start, start + len(paragraph)))
+                start += len(paragraph) + 1
+            return res
+        old = self.text_widget._setup_font()
+        res = []
+        paragraph_start = 0
+        for paragraph in text.split("\n"):
+            advances = [0]
+            for metrics in font_object.metrics(paragraph):
+                advances.append(advances[-1] + (metrics[4] if metrics else 0))
+            left, n = 0, len(paragraph)
+            for index in range(n):
+                if advances[index + 1] - advances[left] > w and index > left:
+                    # measured first, then break at the last space before the overflow (inside a word only if there is none)
+                    last_space = paragraph.rfind(" ", left + 1, index + 1)
+                    cut = last_space if last_space != -1 else index
+                    end = cut
+                    while end > left and paragraph[end - 1] == " ":
+                        end -= 1
+                    res.append((paragraph_start + left, paragraph_start + end))
+                    left = cut
+                    while left < n and paragraph[left] == " ":
+                        left += 1
+            res.append((paragraph_start + left, paragraph_start + n))
+            paragraph_start += n + 1
+        self.text_widget._reset_font(old)
+        return res
 
-                if last_space != -1 or last_nline != -1:  # space was found !:
-                    cut_point_start = max(last_space, last_nline)
-                    cut_point_end = cut_point_start + 1
-                res = [text[:cut_point_start].strip()]
-                res.extend(self.cut_text_to_width(text[cut_point_end:].strip()))
-                return res
-            elif text[index] == "\n":
-                left = index
-        return [text]
+    def _get_layout(self) -> list[tuple[int, int]]:
+        tw = self.text_widget
+        key = (self.original_text, self.autoresize_w, self.get_inner_width(), tw.font_object, tw.is_bold, tw.is_italic)
+        if key != self._layout_key:
+            self._layout_key = key
+            self._layout = self._wrap(self.original_text)
+            self._layout_starts = [start for start, _ in self._layout]
+            self._revealed_lines = (0, "")
+        return self._layout
 
+    def _update_text(self) -> None:
+        """
+        Shows the text revealed up to the cursor : the fully revealed lines (joined once) and part of the current one
+        """
+        layout = self._get_layout()
+        index = int(self.cursor_position)
+        current = max(0, bisect_left(self._layout_starts, index) - 1)
+        count, full_lines = self._revealed_lines
+        if count != current:
+            full_lines = "".join(
+                f"{self.original_text[start:end]}\n" for start, end in layout[:current]
+            )
+            self._revealed_lines = (current, full_lines)
+        start, end = layout[current]
+        self._set_text_internal(full_lines + self.original_text[start:max(start, min(end, index))])
 
     def _set_text_internal(self,text:str)->Self:
         super().set_text(text)
@@ -68,10 +121,12 @@ class AnimatedLabel(Label):
         self.original_text = text
         self.is_over = False
         self.cursor_position = 0
+        self._update_text()
+        return self
 
     def set_size(self, size):
         super().set_size(size)
-        self._set_text_internal('\n'.join(self.cut_text_to_width(self.original_text[: int(self.cursor_position)])))
+        self._update_text()
 
     def do_update(self, dt):
         if self.is_over:
@@ -83,8 +138,9 @@ class AnimatedLabel(Label):
             if self.end_callback is not None:
                 self.end_callback()
             return
+        old_index = int(self.cursor_position)
         self.cursor_position = min(
             self.cursor_position + self.text_speed * dt, len(self.original_text)
         )
-        # self.set_text(self.original_text[: int(self.cursor_position)])
-        self._set_text_internal('\n'.join(self.cut_text_to_width(self.original_text[: int(self.cursor_position)])))
+        if int(self.cursor_position) != old_index:
+            self._update_text()
@@ -235,6 +235,9 @@ class ClickableWidget(Shape, InteractiveWidget):
             self.rect.h - self.unpressed_relief,
         )
 
+    def _draws_on_background(self) -> bool:
+        return not self.is_enabled or self.is_hovered or type(self).paint is not ClickableWidget.paint
+
     def paint(self) -> None:
         super().paint()
         if not self.is_enabled:
@@ -1,5 +1,6 @@
 import pygame
 import batFramework as bf
+from math import ceil
 from .widget import Widget
 from .shape import Shape
 from .interactiveWidget import InteractiveWidget
@@ -9,6 +10,8 @@ from pygame.math import Vector2
 
 
 class Container(Shape, InteractiveWidget):
+    layout: Layout | None = None
+
     def __init__(self, layout: Layout = None, *children: Widget) -> None:
         super().__init__()
         self.dirty_layout: bool = False
@@ -16,6 +19,10 @@ class Container(Shape, InteractiveWidget):
         self.layout.set_parent(self)
         self.scroll = Vector2(0, 0)
         self.dirty_scroll = False
+        # subtree drawn once into _cache_surface, drawn again when a descendant changes (see set_render_cache)
+        self.render_cache: bool = False
+        self.dirty_render_cache: bool = True
+        self._cache_surface: pygame.Surface | None = None
         self.set_debug_color("green")
         self.add(*children)
 
@@ -26,6 +33,24 @@ class Container(Shape, InteractiveWidget):
     def get_min_required_size(self):
         return self.layout.get_auto_size() if self.layout else self.rect.size
 
+    def set_render_cache(self, value: bool) -> Self:
+        """
+        If True, the container and its children are drawn into a single surface,
+        which is only drawn again when one of them repaints, moves or is shown/hidden.
+        Meant for static panels, only used while children are clipped
+        """
+        if value == self.render_cache:
+            return self
+        self.render_cache = value
+        Widget._render_caches += 1 if value else -1
+        self._tree_changed()
+        self.dirty_render_cache = True
+        self._cache_surface = None
+        return self
+
+    def _forget_min_size(self) -> bool:
+        return self.layout.forget_raw_size() if self.layout else True
+
     def reset_scroll(self) -> Self:
         if self.scroll == (0,0):
             return self
@@ -99,6 +124,7 @@ class Container(Shape, InteractiveWidget):
             self.layout.set_parent(self)
             self.reset_scroll()
             self.dirty_layout = True
+            self._min_size_changed()
         return self
 
     def get_interactive_children(self) -> list[InteractiveWidget]:
@@ -114,7 +140,12 @@ class Container(Shape, InteractiveWidget):
     def clear_children(self) -> None:
         for child in self.children:
             child.set_parent(None)
+            child.set_parent_scene(None)
+            child.set_parent_layer(None)
         self.children.clear()
+        self._tree_changed()
+        self._render_changed()
+        self.dirty_shape = True
         self.dirty_layout = True
 
     def add(self, *child: Widget) -> Self:
@@ -138,6 +169,15 @@ class Container(Shape, InteractiveWidget):
             return self
         return None
 
+    _indexed_top_at = top_at
+
+    def _add_hit_entries(self, index, clip: pygame.FRect | None) -> None:
+        # children are only hit inside the container
+        clip = self.rect.clip(clip) if clip is not None else self.rect.copy()
+        index.add(self, clip)
+        for child in self.children:
+            index.add_tree(child, clip)
+
     def get_focus(self) -> bool:
         if not super().get_focus():
             return False
@@ -216,5 +256,48 @@ class Container(Shape, InteractiveWidget):
         if self.dirty_surface and not skip_draw:
             self.paint()
             self.dirty_surface = False
-
-
+            self._render_changed()  # the new surface shows from now on
+
+    def draw(self, camera: bf.Camera) -> None:
+        if not self.render_cache or not self.clip_children:
+            self._draw_tree(camera)
+            return
+        if not camera.world_rect.colliderect(self.rect):
+            return
+        if self.dirty_render_cache or self._cache_surface is None:
+            self._update_render_cache(camera)
+        camera.surface.blit(self._cache_surface, camera.world_to_screen(self.rect))
+
+    _flat_draw = draw
+
+    def _draw_tree(self, camera: bf.Camera) -> None:
+        """
+        Draws the container and its children
+        """
+        super().draw(camera)
+
+    def _add_draw_entries(self, draw_list, clip) -> None:
+        if self.render_cache and self.clip_children:
+            draw_list.add_custom(self, clip)  # drawn from the cache
+        else:
+            self._add_tree_draw_entries(draw_list, clip)
+
+    def _add_tree_draw_entries(self, draw_list, clip) -> None:
+        """
+        Mirrors _draw_tree
+        """
+        super()._add_draw_entries(draw_list, clip)
+
+    def _update_render_cache(self, camera: bf.Camera) -> None:
+        size = (ceil(self.rect.w), ceil(self.rect.h))
+        if self._cache_surface is None or self._cache_surface.get_size() != size:
+            self._cache_surface = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+        self._cache_surface.fill((0, 0, 0, 0))
+        # the camera draws into the cache for the time of the tree draw
+        surface, world_rect = camera.surface, camera.world_rect
+        camera.surface, camera.world_rect = self._cache_surface, pygame.FRect(self.rect.topleft, size)
+        try:
+            self._draw_tree(camera)
+        finally:
+            camera.surface, camera.world_rect = surface, world_rect
+        self.dirty_render_cache = False
@@ -99,6 +99,8 @@ class Debugger(Label):
     def __str__(self) -> str:
         return "Debugger"
 
+    hit_testable = False
+
     def top_at(self, x, y):
         return None
 
@@ -43,7 +43,7 @@ class DraggableWidget(InteractiveWidget):
 
     def update(self, dt: float):
         super().update(dt)
-        self.is_dragged_outside = any(i==j and i== True for i,j in zip(pygame.mouse.get_pressed(5),self.click_mask))
+        self.is_dragged_outside = any(i==j and i== True for i,j in zip(bf.InputState().get_mouse_pressed(5),self.click_mask))
 
 
         if self.is_dragged and self.is_dragged_outside:
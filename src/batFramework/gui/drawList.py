@@ -0,0 +1,74 @@
+import pygame
+
+
+class DrawList:
+    """
+    Flat list of the widgets Root draws, in draw order, grouped in runs sharing a clip rect and blit flags.
+    Built from the widget tree by Root when the tree or the camera changes, then drawn
+    with one fblits per run instead of a recursive draw.
+    Widgets with a custom draw are kept whole and drawn by themselves, under their clip.
+    """
+
+    def __init__(self) -> None:
+        self.key = None  # (tree version, camera state) the list was built for
+        self.camera = None  # camera used while building
+        self._runs: list[tuple] = []  # (clip, blit flags, widgets, custom draw)
+        self._count: int = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def build(self, root, camera, key) -> None:
+        self._runs.clear()
+        self._count = 0
+        self.camera = camera
+        root._add_draw_entries(self, camera.surface.get_clip())
+        self.camera = None
+        self.key = key
+
+    def add_tree(self, widget, clip) -> None:
+        """
+        Adds widget and its descendants
+        """
+        cls = type(widget)
+        if cls.draw is not cls._flat_draw or "draw" in widget.__dict__:
+            self.add_custom(widget, clip)
+            return
+        widget._add_draw_entries(self, clip)
+
+    def add(self, widget, clip) -> None:
+        """
+        Adds the widget surface, if the widget would draw it
+        """
+        if not widget.visible or widget.drawn_by_group or not self.camera.world_rect.colliderect(widget.rect):
+            return
+        self._count += 1
+        if self._runs:
+            last_clip, flags, widgets, custom = self._runs[-1]
+            if not custom and flags == widget.blit_flags and last_clip == clip:
+                widgets.append(widget)
+                return
+        self._runs.append((clip, widget.blit_flags, [widget], False))
+
+    def add_custom(self, widget, clip) -> None:
+        self._count += 1
+        self._runs.append((clip, 0, [widget], True))
+
+    def draw(self, camera) -> None:
+        surface = camera.surface
+        old_clip = surface.get_clip()
+        left, top = camera.world_rect.topleft
+        for clip, flags, widgets, custom in self._runs:
+            surface.set_clip(clip)
+            if custom:
+                widgets[0].draw(camera)
+                continue
+            surface.fblits(
+                [
+                    (w.surface, (w.rect.x - left, w.rect.y - top))
+                    for w in widgets
+                    if w.surface.get_alpha() != 0
+                ],
+                flags,
+            )
+        surface.set_clip(old_clip)
@@ -0,0 +1,75 @@
+from math import floor
+import pygame
+
+
+class HitIndex:
+    """
+    Grid of the hit-testable widget rects (clipped like top_at does), in top_at priority order.
+    Built from the widget tree by Root when the tree stops changing, then answers top_at queries
+    by only testing the widgets in the cell under the point.
+    Widgets with a custom top_at are kept whole and asked at query time.
+    """
+
+    CELL_SIZE = 64
+
+    def __init__(self) -> None:
+        self.version: int = -1  # widget tree version the index was built for
+        self._entries: list[tuple] = []  # (rect, widget, custom top_at), lowest priority first
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        self._everywhere: list[int] = []  # entries without a bounding rect
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def build(self, root, version: int) -> None:
+        self._entries.clear()
+        self._cells.clear()
+        self._everywhere.clear()
+        root._add_hit_entries(self, None)
+        self.version = version
+
+    def add_tree(self, widget, clip: pygame.FRect | None) -> None:
+        """
+        Adds widget and its hit-testable descendants
+        """
+        if not widget.visible or not widget.hit_testable:
+            return
+        cls = type(widget)
+        if cls.top_at is not cls._indexed_top_at or "top_at" in widget.__dict__:
+            self.add(widget, clip, custom=True)
+            return
+        widget._add_hit_entries(self, clip)
+
+    def add(self, widget, rect: pygame.FRect | None, custom: bool = False) -> None:
+        if rect is not None and (rect.w <= 0 or rect.h <= 0):
+            return
+        index = len(self._entries)
+        self._entries.append((rect, widget, custom))
+        if rect is None:
+            self._everywhere.append(index)
+            return
+        size = self.CELL_SIZE
+        cells = self._cells
+        for cx in range(floor(rect.left / size), floor(rect.right / size) + 1):
+            for cy in range(floor(rect.top / size), floor(rect.bottom / size) + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    cell.append(index)
+
+    def top_at(self, x: float, y: float):
+        size = self.CELL_SIZE
+        candidates = self._cells.get((floor(x / size), floor(y / size)), [])
+        if self._everywhere:
+            candidates = sorted(candidates + self._everywhere)
+        entries = self._entries
+        for index in reversed(candidates):
+            rect, widget, custom = entries[index]
+            if custom:
+                result = widget.top_at(x, y)
+                if result is not None:
+                    return result
+            elif rect.collidepoint(x, y):
+                return widget
+        return None
@@ -29,6 +29,8 @@ class Indicator(Shape):
     def get_value(self) -> Any:
         pass
 
+    hit_testable = False
+
     def top_at(self, x, y):
         return None
 
@@ -15,6 +15,7 @@ class Layout(ABC):
         self.parent = parent
         self.child_constraints: list[Constraint] = []
         self.children_rect = pygame.FRect(0, 0, 0, 0)
+        self._raw_size: tuple[float, float] | None = None  # memo of get_raw_size, forgotten when the parent or a descendant changes shape
 
     def get_free_space(self)->tuple[float,float]:
         """
@@ -30,11 +31,21 @@ class Layout(ABC):
 
     def set_parent(self, parent: Widget):
         self.parent = parent
+        self._raw_size = None
         self.notify_parent()
 
+    def forget_raw_size(self) -> bool:
+        """
+        returns False if it was already forgotten
+        """
+        known = self._raw_size is not None
+        self._raw_size = None
+        return known
+
     def notify_parent(self) -> None:
         if self.parent:
             self.parent.dirty_layout = True
+            self.parent._min_size_changed()
 
     def update_children_rect(self):
         if self.parent.get_layout_children():
@@ -65,9 +76,10 @@ class Layout(ABC):
         """
         Returns the size the container should have to encapsulate perfectly all of its widgets
         """
-        # print(self,self.parent,len(self.parent.get_layout_children()))
-        self.update_children_rect() # TODO: find  a way to call this fewer times
-        return self.children_rect.size
+        if self._raw_size is None:
+            self.update_children_rect()
+            self._raw_size = tuple(self.children_rect.size)
+        return self._raw_size
 
     def get_auto_size(self) -> tuple[float, float]:
         """
@@ -149,6 +149,8 @@ class BarMeter(Meter):
                 self.content.rect.bottomleft = (padded.left + self.outline_width, padded.bottom - self.outline_width)
             else:  # bf.direction.DOWN
                 self.content.rect.topleft = padded.move(self.outline_width, self.outline_width).topleft
+        self._tree_changed()  # content rect was moved directly
+        self._render_changed()
 
     def build(self) -> None:
         self._build_content()
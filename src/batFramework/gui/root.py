@@ -1,8 +1,11 @@
 import batFramework as bf
 from .interactiveWidget import InteractiveWidget
 from .widget import Widget
+from .hitIndex import HitIndex
+from .drawList import DrawList
 import pygame
 from typing import Self
+from contextlib import contextmanager
 import sys
 
 
@@ -15,6 +18,13 @@ class Root(InteractiveWidget):
         self.rect.size = pygame.display.get_surface().get_size()
         self.focused: InteractiveWidget | None = self
         self.hovered: Widget | None = self
+        # hover lookup : skipped while the mouse and the tree don't change,
+        # done with the hit index once the tree stays the same for a frame
+        self.hit_index = HitIndex()
+        self._hover_pos = None
+        self._hover_version: int = -1
+        # children drawn from a flat list, built again when the tree or the camera changes
+        self.draw_list = DrawList()
         self.clip_children = False
         self.set_debug_color("yellow")
 
@@ -40,6 +50,19 @@ class Root(InteractiveWidget):
     def set_parent_scene(self, parent_scene: bf.Scene) -> Self:
         return super().set_parent_scene(parent_scene)
 
+    @contextmanager
+    def batch(self):
+        """
+        Bulk building : widgets added in the block are only linked to their parent.
+        Styles, layer and scene are given once for the whole tree, and children sorted, when the block ends
+        """
+        Widget._begin_batch()
+        try:
+            with bf.gui.StyleManager().suspend():
+                yield self
+        finally:
+            Widget._end_batch()
+
     def get_focused(self) -> Widget | None:
         return self.focused
 
@@ -105,6 +128,7 @@ class Root(InteractiveWidget):
         if not force:
             return self
         self.rect.size = size
+        self._tree_changed()
         self.dirty_shape = True
         self.dirty_size_constraints = True
         return self
@@ -127,7 +151,7 @@ class Root(InteractiveWidget):
     def tab_focus(self,event=None):
         if self.focused is None:
             return
-        keys = pygame.key.get_pressed()
+        keys = bf.InputState().get_keys()
         if keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]:
             self.focused.focus_prev_tab(self.focused)
         else:
@@ -147,13 +171,34 @@ class Root(InteractiveWidget):
                 return r
         return self if self.rect.collidepoint(x, y) else None
 
+    _indexed_top_at = top_at
+
+    def _add_hit_entries(self, index, clip) -> None:
+        index.add(self, self.rect.copy())
+        for child in self.children:
+            index.add_tree(child, clip)
+
+    def get_hovered_at(self, x: float, y: float) -> "None|Widget":
+        """
+        Same as top_at, using the hit index when the tree hasn't changed since the last call
+        """
+        version = self.tree_version
+        if version != self._hover_version:
+            self._hover_version = version
+            return self.top_at(x, y)
+        if self.hit_index.version != version:
+            self.hit_index.build(self, version)
+        return self.hit_index.top_at(x, y)
+
     def update(self, dt: float) -> None:
         super().update(dt)
         self.update_tree()
 
         mouse_world = self.drawing_camera.get_mouse_pos()
         prev_hovered = self.hovered
-        self.hovered = self.top_at(*mouse_world)
+        if mouse_world != self._hover_pos or self.tree_version != self._hover_version:
+            self._hover_pos = mouse_world
+            self.hovered = self.get_hovered_at(*mouse_world)
 
         if (self.hovered and self.hovered.tooltip_text and self.show_tooltip):
             self.tooltip.set_text(self.hovered.tooltip_text)
@@ -206,19 +251,21 @@ class Root(InteractiveWidget):
     def apply_post_updates(self, skip_draw = False):
         return
 
-    def draw(self, camera: bf.Camera) -> None:
+    def _add_draw_entries(self, draw_list, clip) -> None:
         if self.clip_children:
-            new_clip = camera.world_to_screen(self.get_inner_rect())
-            old_clip = camera.surface.get_clip()
-            camera.surface.set_clip(new_clip)
-
-        # Draw each child widget, sorted by render order
-        for child in [c for c in self.children if c != self.tooltip]:
+            clip = draw_list.camera.world_to_screen(self.get_inner_rect())
+        for child in self.children:
+            if not child.indexed:  # the tooltip, drawn last
+                continue
             if (not self.clip_children) or (child.rect.colliderect(self.rect) or not child.rect):
-                child.draw(camera)
-        if self.clip_children:
-            camera.surface.set_clip(old_clip)
-        
+                draw_list.add_tree(child, clip)
+
+    def draw(self, camera: bf.Camera) -> None:
+        key = (self.tree_version, tuple(camera.world_rect), tuple(camera.surface.get_clip()))
+        if key != self.draw_list.key:
+            self.draw_list.build(self, camera, key)
+        self.draw_list.draw(camera)
+
         if self.focused != self and (not self.focused is None)  :
             old_clip = camera.surface.get_clip()
             camera.surface.set_clip(self.focused.parent.get_inner_rect())
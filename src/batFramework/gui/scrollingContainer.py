@@ -151,6 +151,19 @@ class ScrollingContainer(Container):
         if res: return res        
         return super().top_at(x, y)
 
+    _indexed_top_at = top_at
+
+    def _add_hit_entries(self, index, clip: pygame.FRect | None) -> None:
+        # scrollbars are tested first, and not clipped by the container
+        scrollbars = (self.y_scrollbar, self.x_scrollbar)
+        inner_clip = self.rect.clip(clip) if clip is not None else self.rect.copy()
+        index.add(self, inner_clip)
+        for child in self.children:
+            if child not in scrollbars:
+                index.add_tree(child, inner_clip)
+        index.add_tree(self.x_scrollbar, clip)
+        index.add_tree(self.y_scrollbar, clip)
+
 
     def get_inner_width(self):
         r = super().get_inner_width()
@@ -262,7 +275,7 @@ class ScrollingContainer(Container):
         
 
 
-    def draw(self, camera):
+    def _draw_tree(self, camera):
         bf.Drawable.draw(self,camera)
 
         if self.clip_children:
@@ -280,3 +293,9 @@ class ScrollingContainer(Container):
 
         self.y_scrollbar.draw(camera)
         self.x_scrollbar.draw(camera)
+
+    def _add_tree_draw_entries(self, draw_list, clip) -> None:
+        super()._add_tree_draw_entries(draw_list, clip)
+        # scrollbars are drawn again over the children, not clipped by the container
+        draw_list.add_tree(self.y_scrollbar, clip)
+        draw_list.add_tree(self.x_scrollbar, clip)
@@ -8,6 +8,8 @@ from .widget import Widget
 from .syncedVar import SyncedVar
 
 class MyArrow(ArrowIndicator, ClickableWidget):
+    hit_testable = True
+
     def top_at(self, x, y):
         return Widget.top_at(self, x, y)
 
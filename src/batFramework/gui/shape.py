@@ -5,7 +5,20 @@ from typing import Self, Iterable
 from math import ceil
 
 
+def _color_key(color) -> tuple | None:
+    return None if color is None else tuple(pygame.Color(color))
+
+
 class Shape(Widget):
+    # nine-slice pieces per (texture, subsize) and finished panels per (texture, subsize, size),
+    # shared by every shape using the texture
+    _slices_cache: dict[tuple, tuple[pygame.Surface, ...]] = {}
+    _panel_cache: dict[tuple, pygame.Surface] = {}
+    PANEL_CACHE_SIZE = 128
+    # painted backgrounds per visual parameters, shared by shapes that look the same
+    _background_cache: dict[tuple, pygame.Surface] = {}
+    BACKGROUND_CACHE_SIZE = 256
+
     def __init__(self, size: tuple[float, float]|None = None, *args, **kwargs):
         super().__init__(size=size, convert_alpha=True)
         self.color = (0, 0, 0, 0)
@@ -17,6 +30,7 @@ class Shape(Widget):
         self.relief = 0
         self.shadow_color: pygame.typing.ColorLike = (0, 0, 0, 255)
         self.draw_mode = bf.drawMode.SOLID
+        self._shared_surface: bool = False  # surface is a cached background, it must not be drawn on
 
     def get_inner_bottom(self) -> float:
         return self.rect.bottom - self.padding[3] - self.relief
@@ -63,7 +77,7 @@ class Shape(Widget):
         self.texture_surface = surface
         if subsize is None:
             subsize = (ceil(surface.get_width() / 3), ceil(surface.get_height() / 3))
-        self.texture_subsize = subsize
+        self.texture_subsize = tuple(subsize)
         self.dirty_surface = True
         return self
 
@@ -106,8 +120,66 @@ class Shape(Widget):
         self.dirty_surface = True
         return self
 
+    def set_alpha(self, alpha: int) -> Self:
+        self._own_surface()
+        return super().set_alpha(alpha)
+
+    def _own_surface(self) -> None:
+        """
+        Copy on write : replaces a shared background by a copy before it gets modified
+        """
+        if self._shared_surface:
+            self.surface = self.surface.copy()
+            self._shared_surface = False
+
+    def _draws_on_background(self) -> bool:
+        """
+        Return True if paint draws over the background, which then can't be shared
+        """
+        return type(self).paint is not Shape.paint
+
+    def _get_background_key(self, size: tuple[int, int]) -> tuple:
+        if self.draw_mode == bf.drawMode.TEXTURED:
+            return (type(self), size, self.draw_mode, self.texture_surface, self.texture_subsize)
+        return (
+            type(self), size, self.draw_mode,
+            _color_key(self.color), _color_key(self.shadow_color), _color_key(self.outline_color),
+            self.outline_width, tuple(self.border_radius), self.relief,
+            tuple(self._get_elevated_rect()), tuple(self._get_base_rect()),
+        )
+
+    def get_background(self) -> pygame.Surface:
+        """
+        Returns the painted background of the shape at its current size.
+        Backgrounds are shared between shapes with the same look : don't draw on the returned surface
+        """
+        size = tuple(max(0, int(i)) for i in self.rect.size)
+        key = self._get_background_key(size)
+        background = Shape._background_cache.get(key)
+        if background is None:
+            if len(Shape._background_cache) >= Shape.BACKGROUND_CACHE_SIZE:
+                del Shape._background_cache[next(iter(Shape._background_cache))]
+            background = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            surface, shared = self.surface, self._shared_surface
+            self.surface = background
+            self._paint_background()
+            self.surface, self._shared_surface = surface, shared
+            Shape._background_cache[key] = background
+        return background
+
     def paint(self) -> None:
+        background = self.get_background()
+        if not self._draws_on_background() and self.surface.get_alpha() in (None, 255):
+            self.surface = background
+            self._shared_surface = True
+            return
+        self._own_surface()
         self._resize_surface()
+        # exact copy (the surface is transparent)
+        self.surface.fill((0, 0, 0, 0))
+        self.surface.blit(background, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+    def _paint_background(self) -> None:
         if self.draw_mode == bf.drawMode.TEXTURED:
             self._paint_textured()
             return
@@ -124,16 +196,70 @@ class Shape(Widget):
         self.surface.fill((0, 0, 0, 0))
         if self.texture_surface is None:
             return
-        w, h = self.surface.get_size()
-        sw, sh = self.texture_surface.get_size()
-        sub = self.texture_subsize
-
-        # center
-        center_surface = self.texture_surface.subsurface((sub[0], sub[1], *sub))
-        top_surface = self.texture_surface.subsurface((sub[0], 0, *sub))
-        bottom_surface = self.texture_surface.subsurface((sub[0], sh - sub[1], *sub))
-        left_surface = self.texture_surface.subsurface((0, sub[1], *sub))
-        right_surface = self.texture_surface.subsurface((sw - sub[0], sub[1], *sub))
+        panel = Shape.get_panel(self.texture_surface, self.texture_subsize, self.surface.get_size())
+        # exact copy (the surface is transparent)
+        self.surface.blit(panel, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+
+    @staticmethod
+    def clear_texture_cache(texture: pygame.Surface | None = None) -> None:
+        """
+        Drops the cached slices and panels of texture (of every texture if None).
+        Call it after drawing on a texture used by shapes
+        """
+        for cache in (Shape._slices_cache, Shape._panel_cache):
+            for key in [k for k in cache if texture is None or k[0] is texture]:
+                del cache[key]
+
+    @staticmethod
+    def _get_slices(texture: pygame.Surface, sub: tuple[int, int]) -> tuple[pygame.Surface, ...]:
+        """
+        Returns the nine slices of texture : corners (topleft, topright, bottomleft, bottomright),
+        then the center and edges (top, bottom, left, right)
+        """
+        key = (texture, sub)
+        slices = Shape._slices_cache.get(key)
+        if slices is None:
+            sw, sh = texture.get_size()
+            slices = tuple(
+                texture.subsurface(r)
+                for r in (
+                    (0, 0, *sub),
+                    (sw - sub[0], 0, *sub),
+                    (0, sh - sub[1], *sub),
+                    (sw - sub[0], sh - sub[1], *sub),
+                    (sub[0], sub[1], *sub),
+                    (sub[0], 0, *sub),
+                    (sub[0], sh - sub[1], *sub),
+                    (0, sub[1], *sub),
+                    (sw - sub[0], sub[1], *sub),
+                )
+            )
+            Shape._slices_cache[key] = slices
+        return slices
+
+    @staticmethod
+    def get_panel(texture: pygame.Surface, sub: tuple[int, int], size: tuple[int, int]) -> pygame.Surface:
+        """
+        Returns the nine-slice panel of texture at size.
+        Panels are shared between shapes : don't draw on the returned surface
+        """
+        key = (texture, sub, size)
+        panel = Shape._panel_cache.get(key)
+        if panel is None:
+            if len(Shape._panel_cache) >= Shape.PANEL_CACHE_SIZE:
+                del Shape._panel_cache[next(iter(Shape._panel_cache))]
+            panel = Shape._build_panel(texture, sub, size)
+            Shape._panel_cache[key] = panel
+        return panel
+
+    @staticmethod
+    def _build_panel(texture: pygame.Surface, sub: tuple[int, int], size: tuple[int, int]) -> pygame.Surface:
+        panel = pygame.Surface(size, pygame.SRCALPHA)
+        w, h = size
+        (
+            topleft_surface, topright_surface, bottomleft_surface, bottomright_surface,
+            center_surface, top_surface, bottom_surface, left_surface, right_surface,
+        ) = Shape._get_slices(texture, sub)
 
         lst = []
         for y in range(sub[1], h + 1 - sub[1] * 2, sub[1]):
@@ -204,23 +330,15 @@ class Shape(Widget):
                 for y in range(sub[1], h + 1 - sub[1] * 2, sub[1])
             ]
             + [
-                (self.texture_surface.subsurface((0, 0, *sub)), (0, 0)),
-                (
-                    self.texture_surface.subsurface((sw - sub[0], 0, *sub)),
-                    (w - sub[0] - 1, 0),
-                ),
-                (
-                    self.texture_surface.subsurface((0, sh - sub[1], *sub)),
-                    (0, h - sub[1] - 1),
-                ),
-                (
-                    self.texture_surface.subsurface((sw - sub[0], sh - sub[1], *sub)),
-                    (w - sub[0] - 1, h - sub[1] - 1),
-                ),
+                (topleft_surface, (0, 0)),
+                (topright_surface, (w - sub[0] - 1, 0)),
+                (bottomleft_surface, (0, h - sub[1] - 1)),
+                (bottomright_surface, (w - sub[0] - 1, h - sub[1] - 1)),
             ]
         )
 
-        self.surface.fblits(lst)
+        panel.fblits(lst)
+        return panel
 
     def _get_elevated_rect(self) -> pygame.FRect:
         return pygame.FRect(0, 0, self.rect.w, self.rect.h - self.relief)
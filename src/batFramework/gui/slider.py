@@ -29,6 +29,8 @@ class SliderHandle(Indicator, DraggableWidget):
     def __str__(self) -> str:
         return "SliderHandle"
 
+    hit_testable = True
+
     def top_at(self, x, y):
         return Shape.top_at(self,x,y)
 
@@ -139,7 +141,7 @@ class SliderMeter(BarMeter, InteractiveWidget):
             if event.type in [pygame.MOUSEBUTTONUP,pygame.MOUSEBUTTONDOWN] and event.button in [4,5]:
                 event.consumed = True
             elif event.type == pygame.MOUSEWHEEL:
-                keys = pygame.key.get_pressed()
+                keys = bf.InputState().get_keys()
                 shift_held = keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]
                 is_vertical = self.axis == bf.axis.VERTICAL
                 is_horizontal = not is_vertical
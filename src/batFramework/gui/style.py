@@ -2,9 +2,26 @@ from .widget import Widget
 
 
 class Style:
+    """
+    Base class of the styles given to the StyleManager.
+    widget_types and tags restrict the widgets a style is applied to (empty means all).
+    Tags are checked when the widget is styled : tags added after creation need
+    StyleManager().refresh_widget, or a StyleManager().suspend() block around the construction.
+    """
+    widget_types: tuple[type, ...] = ()
+    tags: tuple[str, ...] = ()
 
     def __init__(self):
         pass
 
+    def matches_type(self, widget_type: type) -> bool:
+        return not self.widget_types or issubclass(widget_type, self.widget_types)
+
+    def matches(self, widget: Widget) -> bool:
+        """
+        Called after matches_type, for checks that depend on the widget itself
+        """
+        return not self.tags or widget.has_any_tags(*self.tags)
+
     def apply(self, widget: Widget):
         pass
@@ -1,49 +1,115 @@
+from contextlib import contextmanager
 from ..utils import Singleton
 from .widget import Widget
 from .style import Style
 import batFramework as bf
 
 class StyleManager(metaclass=Singleton):
+    """
+    Applies the styles to each widget once, when it is created.
+    Styles are matched through an index by widget class (see Style.widget_types),
+    and styling can be suspended while building many widgets (see suspend).
+    """
     def __init__(self):
         self.styles: list[Style] = []
         self.widgets: set[Widget] = set()
-        self.lookup: dict[Widget, bool] = {}
+        self.pending: dict[Widget, None] = {}  # widgets waiting to be styled, in creation order
+        self._pending_styles: list[Style] = []  # styles added while suspended, not applied to the other widgets yet
+        self._styles_by_type: dict[type, list[Style]] = {}
+        self._suspended: int = 0
+
+    def _get_styles(self, widget: Widget) -> list[Style]:
+        """
+        Styles that may apply to the widget, in the order they were added
+        """
+        cls = type(widget)
+        styles = self._styles_by_type.get(cls)
+        if styles is None:
+            styles = [s for s in self.styles if s.matches_type(cls)]
+            self._styles_by_type[cls] = styles
+        return styles
+
+    def _apply_styles(self, widget: Widget):
+        for style in self._get_styles(widget):
+            if style.matches(widget):
+                style.apply(widget)
+
+    def _apply_new_style(self, style: Style, widgets) -> None:
+        """
+        Applies a style added after the widgets were styled (on top of the styles they already have)
+        """
+        for widget in widgets:
+            if style.matches_type(type(widget)) and style.matches(widget):
+                style.apply(widget)
 
     def register_widget(self, widget: Widget):
         if widget in self.widgets:
             return
         self.widgets.add(widget)
-        self.lookup[widget] = False
-        self.update()
+        if self._suspended:
+            self.pending[widget] = None
+        else:
+            self._apply_styles(widget)
 
     def refresh_widget(self, widget: Widget):
-        if widget in self.widgets:
-            self.lookup[widget] = False
-            self.update()
+        """
+        Applies the styles to the widget again
+        """
+        if widget not in self.widgets:
+            return
+        if self._suspended:
+            self.pending[widget] = None
+        else:
+            self._apply_styles(widget)
 
     def remove_widget(self, widget: Widget):
         if widget not in self.widgets:
             return
         self.widgets.remove(widget)
-        self.lookup.pop(widget)
+        self.pending.pop(widget, None)
 
     def add(self, style: Style):
+        """
+        Applies the style to the styled widgets (widgets styled later get every style, in the order they were added)
+        """
         self.styles.append(style)
-        self.lookup = {key: False for key in self.lookup}
-        self.update()
+        self._styles_by_type.clear()
+        if self._suspended:
+            self._pending_styles.append(style)
+            return
+        self._apply_new_style(style, self.widgets)
+
+    @contextmanager
+    def suspend(self):
+        """
+        Defers styling of the widgets created (or refreshed) in the block to its end.
+        Can be nested, widgets are styled when the outermost block ends
+        """
+        self._suspended += 1
+        try:
+            yield self
+        finally:
+            self._suspended -= 1
+            if not self._suspended:
+                self.update()
 
     def update_forced(self):
-        for style in self.styles:
-            for widget in self.widgets:    
-                style.apply(widget)
-        for key in self.lookup.keys():
-            self.lookup[key] = True
+        self.pending.clear()
+        self._pending_styles.clear()
+        for widget in self.widgets:
+            self._apply_styles(widget)
 
     def update(self):
-        for style in self.styles:
-            for widget in self.widgets:
-                if self.lookup[widget]:
-                    continue
-                style.apply(widget)
-        for key in self.lookup.keys():
-            self.lookup[key] = True
+        """
+        Styles the pending widgets, then applies the styles added while suspended to the other widgets,
+        which ends the same as if nothing had been suspended
+        """
+        styled = set()
+        while self.pending:
+            widget = next(iter(self.pending))
+            del self.pending[widget]
+            styled.add(widget)
+            self._apply_styles(widget)  # every style, including the ones added while suspended
+        styles, self._pending_styles = self._pending_styles, []
+        for style in styles:
+            self._apply_new_style(style, [w for w in self.widgets if w not in styled])
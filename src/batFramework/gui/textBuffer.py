@@ -0,0 +1,109 @@
+from bisect import bisect_right
+from typing import Self
+
+
+class TextBuffer:
+    """
+    Editable text stored as a list of lines, with the absolute offset of each line start.
+    An edit only rebuilds the lines it spans, line starts after it are recomputed lazily
+    (and only as far as the next lookup needs).
+    """
+
+    def __init__(self, text: str = "") -> None:
+        self._lines: list[str] = []
+        self._starts: list[int] = []
+        self._length: int = 0
+        self._text: str | None = None
+        self.set_text(text)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __str__(self) -> str:
+        return self.text
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self._lines)
+        return self._text
+
+    @property
+    def line_count(self) -> int:
+        return len(self._lines)
+
+    def set_text(self, text: str) -> Self:
+        self._lines = text.split("\n")
+        self._starts = [0]
+        self._length = len(text)
+        self._text = text
+        return self
+
+    def get_line(self, line: int) -> str | None:
+        if line < 0 or line >= len(self._lines):
+            return None
+        return self._lines[line]
+
+    def get_lines(self) -> list[str]:
+        return self._lines
+
+    def _extend_starts(self, line: int) -> None:
+        # line starts are valid up to len(self._starts)
+        starts, lines = self._starts, self._lines
+        last = min(line, len(lines) - 1)
+        i = len(starts) - 1
+        while i < last:
+            starts.append(starts[i] + len(lines[i]) + 1)
+            i += 1
+
+    def get_line_start(self, line: int) -> int:
+        self._extend_starts(line)
+        return self._starts[line]
+
+    def to_absolute(self, position: tuple[int, int]) -> int:
+        """
+        (column, line) -> offset in the text, clamped to the text
+        """
+        x, y = position
+        y = max(0, min(y, len(self._lines) - 1))
+        x = max(0, min(x, len(self._lines[y])))
+        return self.get_line_start(y) + x
+
+    def to_cursor(self, absolute: int) -> tuple[int, int]:
+        """
+        offset in the text -> (column, line), clamped to the text
+        """
+        absolute = max(0, min(absolute, self._length))
+        starts, lines = self._starts, self._lines
+        while starts[-1] <= absolute and len(starts) < len(lines):
+            i = len(starts) - 1
+            starts.append(starts[i] + len(lines[i]) + 1)
+        y = bisect_right(starts, absolute) - 1
+        return (absolute - starts[y], y)
+
+    def insert(self, absolute: int, text: str) -> Self:
+        if not text:
+            return self
+        x, y = self.to_cursor(absolute)
+        line = self._lines[y]
+        self._lines[y:y + 1] = f"{line[:x]}{text}{line[x:]}".split("\n")
+        self._edited(y, len(text))
+        return self
+
+    def delete(self, start: int, end: int) -> Self:
+        """
+        Removes the text between the two offsets
+        """
+        start, end = max(0, start), min(end, self._length)
+        if start >= end:
+            return self
+        x0, y0 = self.to_cursor(start)
+        x1, y1 = self.to_cursor(end)
+        self._lines[y0:y1 + 1] = [self._lines[y0][:x0] + self._lines[y1][x1:]]
+        self._edited(y0, start - end)
+        return self
+
+    def _edited(self, line: int, length_delta: int) -> None:
+        del self._starts[line + 1:]
+        self._length += length_delta
+        self._text = None
@@ -2,6 +2,7 @@ import batFramework as bf
 from typing import Self, Callable
 from .label import Label
 from .interactiveWidget import InteractiveWidget
+from .textBuffer import TextBuffer
 import pygame
 
 def find_next_word(s: str, start_index: int) -> int:
@@ -64,6 +65,10 @@ class TextInput(Label, InteractiveWidget):
         self.show_cursor = False
         self._cursor_blink_show : bool = True 
         self.on_modify: Callable[[str], str]| None = None
+        # the displayed text, edited in place by keystrokes
+        self.buffer: TextBuffer = TextBuffer()
+        self._cursor_rect_key = None
+        self._cursor_rect_value: tuple[float, float, float, float] = (0, 0, 0, 0)
         self.set_click_pass_through(False)
         super().__init__("")
         self.set_outline_color("black")
@@ -104,21 +109,18 @@ class TextInput(Label, InteractiveWidget):
         self.cursor_timer.resume()
         # self._cursor_toggle(True)
         self.show_cursor = True
+        self._render_changed()
         self.old_key_repeat = pygame.key.get_repeat()
         pygame.key.set_repeat(200, 50)
 
     def do_on_lose_focus(self):
         self.cursor_timer.pause()
         self.show_cursor = False
+        self._render_changed()
         pygame.key.set_repeat(*self.old_key_repeat)
 
     def get_line(self, line: int) -> str | None:
-        if line < 0:
-            return None
-        lines = self.text_widget.text.split('\n')
-        if line >= len(lines):
-            return None
-        return lines[line]
+        return self.buffer.get_line(line)
 
     def get_debug_outlines(self):
         yield from super().get_debug_outlines()
@@ -138,10 +140,11 @@ class TextInput(Label, InteractiveWidget):
     def set_cursor_position(self, position: tuple[int, int]) -> Self:
         x, y = position
 
-        lines = self.text_widget.text.split('\n')
-        y = max(0, min(y, len(lines) - 1))
-        line_length = len(lines[y])
+        y = max(0, min(y, self.buffer.line_count - 1))
+        line_length = len(self.buffer.get_line(y))
         x = max(0, min(x, line_length))
+        if (x, y) != self.cursor_position:
+            self._render_changed()  # the cursor is drawn over the widget
         self.cursor_position = (x,y)
         return self
 
@@ -150,13 +153,13 @@ class TextInput(Label, InteractiveWidget):
             return pygame.FRect(0, 0, 0, 0)
         font = self.text_widget.font_object
 
-        lines = self.text_widget.text.split('\n')
         line_x, line_y = self.cursor_position
-        line = lines[line_y]
+        line = self.buffer.get_line(line_y) or ""
 
-        # # Clamp line_y and line_x to valid ranges
-        # line_y = max(0, min(line_y, len(lines) - 1))
-        # line_x = max(0, min(line_x, len(line)))
+        # the rect only changes when the cursor moves or its line is edited
+        key = (line_x, line_y, line, font, self.text_widget.show_text_outline)
+        if key == self._cursor_rect_key:
+            return pygame.FRect(self._cursor_rect_value)
 
         line_height = font.get_linesize()
 
@@ -169,6 +172,8 @@ class TextInput(Label, InteractiveWidget):
             x+=offset[0]
             y+=offset[1]
         
+        self._cursor_rect_key = key
+        self._cursor_rect_value = (x, y, 1, line_height)
         res = pygame.FRect(x,y,1,line_height)
         return  res
 
@@ -176,26 +181,22 @@ class TextInput(Label, InteractiveWidget):
         pass
 
     def cursor_to_absolute(self, position: tuple[int, int]) -> int:
-        x, y = position
-
-        y = max(0, min(y, len(self.text_widget.text.split('\n')) - 1))
-        lines = self.text_widget.text.split('\n')
-        x = max(0, min(x, len(lines[y])))
-
-        absolute_position = sum(len(line) + 1 for line in lines[:y]) + x
-        return absolute_position
+        return self.buffer.to_absolute(position)
 
     def absolute_to_cursor(self, absolute: int) -> tuple[int, int]:
-        text = self.text_widget.text
-        lines = text.split('\n')
-        current_pos = 0
-
-        for line_no, line in enumerate(lines):
-            if absolute <= current_pos + len(line):
-                return (absolute - current_pos, line_no)
-            current_pos += len(line) + 1
-
-        return (len(lines[-1]), len(lines) - 1)
+        return self.buffer.to_cursor(absolute)
+
+    def _edit(self, start: int, end: int, text: str = "") -> None:
+        """
+        Replaces the text between start and end in the buffer, then displays its lines
+        (the whole text is only joined for the modify callback or the placeholder)
+        """
+        self.buffer.delete(start, end)
+        self.buffer.insert(start, text)
+        if self.on_modify or (self.placeholder_text and not len(self.buffer)):
+            self.set_text(self.buffer.text)
+            return
+        self.text_widget.set_lines(self.buffer.get_lines())
 
     def handle_event(self, event):
         # TODO fix tab_focus not working when textInput in focus
@@ -203,13 +204,13 @@ class TextInput(Label, InteractiveWidget):
         if event.consumed or(not self.is_focused or event.type not in [pygame.TEXTINPUT, pygame.KEYDOWN]):
             return
 
-        text = self.get_text()
+        text_length = len(self.buffer)
         current_pos = self.cursor_to_absolute(self.cursor_position)
-        pressed = pygame.key.get_pressed()
+        pressed = bf.InputState().get_keys()
 
         if event.type == pygame.TEXTINPUT:
             # Insert text at the current cursor position
-            self.set_text(f"{text[:current_pos]}{event.text}{text[current_pos:]}")
+            self._edit(current_pos, current_pos, event.text)
             self.set_cursor_position(self.absolute_to_cursor(current_pos + len(event.text)))
         elif event.type == pygame.KEYDOWN:
             match event.key:
@@ -223,17 +224,17 @@ class TextInput(Label, InteractiveWidget):
                         delta = find_prev_word(self.text_widget.text,current_pos-1)
                         if delta <0: delta = 0
                         
-                    self.set_text(f"{text[:delta]}{text[current_pos:]}")
+                    self._edit(delta, current_pos)
                     self.set_cursor_position(self.absolute_to_cursor(delta))
                     self._cursor_toggle(True)
 
-                case pygame.K_DELETE if current_pos < len(text):
+                case pygame.K_DELETE if current_pos < text_length:
                     # Remove the character at the cursor
-                    self.set_text(f"{text[:current_pos]}{text[current_pos + 1:]}")
+                    self._edit(current_pos, current_pos + 1)
                     self._cursor_toggle(True)
 
                 case pygame.K_RIGHT:
-                    if current_pos < len(text):
+                    if current_pos < text_length:
                         self.handle_cursor_movement(pressed, current_pos, direction="right")
                     self._cursor_toggle(True)
                     
@@ -254,7 +255,7 @@ class TextInput(Label, InteractiveWidget):
 
                 case pygame.K_RETURN:
                     # Insert a newline at the current cursor position
-                    self.set_text(f"{text[:current_pos]}\n{text[current_pos:]}")
+                    self._edit(current_pos, current_pos, "\n")
                     self.set_cursor_position(self.absolute_to_cursor(current_pos + 1))
                     self._cursor_toggle(True)
                 case _ :
@@ -287,7 +288,9 @@ class TextInput(Label, InteractiveWidget):
         if text != "" and text == self.placeholder_text:
             self.text_widget.set_text("")
         self.text_widget.set_text(text)
-
+        if text != self.buffer.text:  # edits went through the buffer already
+            self.buffer.set_text(text)
+            self.set_cursor_position(self.cursor_position)
         return self
     def _draw_cursor(self,camera:bf.Camera) -> None:
         if not self.show_cursor or not self._cursor_blink_show:
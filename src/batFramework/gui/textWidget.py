@@ -5,6 +5,12 @@ import batFramework as bf
 from typing import Literal, Self,Union
 
 class TextWidget(Widget):
+    hit_testable = False
+    # the text is kept as a string or as its lines (see set_lines), the other form is made when asked
+    _text: str | None = ""
+    _lines: list[str] | None = None
+    _text_version: int = 0  # increased on every text change, cheaper to compare than the text
+
     def __init__(self, text:str):
         super().__init__()
         self.text = text
@@ -47,6 +53,17 @@ class TextWidget(Widget):
 
         self.is_underlined: bool = False
 
+        # rendered lines (when not wrapping), kept while the render parameters don't change
+        # so editing a line only renders that line again
+        self._line_cache: dict[str, pygame.Surface] = {}
+        self._line_cache_key: tuple | None = None
+        self._lines_size: tuple = (None, None, (0, 0))  # (text version, (cache key, wraplength), size) of the last measure
+        # surface is a view on this larger buffer, so typing doesn't reallocate it every keystroke
+        self._surface_buffer: pygame.Surface | None = None
+        # lines on the surface at the last paint, to only paint the edited ones again
+        self._painted_lines: list[str] | None = None
+        self._painted_state: tuple | None = None
+
         super().__init__()
         self.set_debug_color("purple")
         self.set_autoresize(True)
@@ -200,6 +217,23 @@ class TextWidget(Widget):
         self.dirty_surface = True
         return self
 
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = "\n".join(self._lines)
+        return self._text
+
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        self._lines = None
+        self._text_version += 1
+
+    def get_lines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = self._text.split("\n")
+        return self._lines
+
     def set_text(self, text: str) -> Self:
         if text == self.text:
             return self
@@ -207,22 +241,49 @@ class TextWidget(Widget):
         self.dirty_shape = True
         return self
 
+    def set_lines(self, lines: list[str]) -> Self:
+        """
+        Sets the text from its lines, without joining them (the text is joined only if asked for)
+        """
+        self._lines = list(lines)
+        self._text = None
+        self._text_version += 1
+        self.dirty_shape = True
+        return self
+
+    def _get_wraplength(self) -> int:
+        return int(self.get_inner_width()) if self.auto_wraplength and not self.autoresize_w else 0
+
     def get_min_required_size(self) -> tuple[float, float]:
         if not self.font_object : return 0,0
 
-        tmp_text = self.text
-        if self.text.endswith('\n'):
-            tmp_text+=" " # hack to have correct size if ends with newline
-        params = {
-            "font_name": self.font_object.name,
-            "text": tmp_text,
-            "antialias": self.antialias,
-            "color": self.text_color,
-            "bgcolor": self.text_bg_color,
-            "wraplength": int(self.get_inner_width()) if self.auto_wraplength and not self.autoresize_w else 0,
-        }
+        wrap = self._get_wraplength()
+        key = (self._get_line_cache_key(self._get_line_bgcolor()), wrap)
+        if self._lines_size[0] == self._text_version and self._lines_size[1] == key:
+            size = list(self._lines_size[2])
+        elif wrap:
+            tmp_text = self.text
+            if self.text.endswith('\n'):
+                tmp_text+=" " # hack to have correct size if ends with newline
+            params = {
+                "font_name": self.font_object.name,
+                "text": tmp_text,
+                "antialias": self.antialias,
+                "color": self.text_color,
+                "bgcolor": self.text_bg_color,
+                "wraplength": wrap,
+            }
+            size = list(self._render_font(params).get_size())
+            self._lines_size = (self._text_version, key, tuple(size))
+        else:
+            lines = self.get_lines()
+            surfaces = self._get_line_surfaces(lines, self._get_line_bgcolor())
+            if len(lines) > 1 or lines[0]:
+                size = [max(map(pygame.Surface.get_width, surfaces)), self.font_object.get_linesize() * len(lines)]
+            else:
+                size = list(surfaces[0].get_size())
+            self._lines_size = (self._text_version, key, tuple(size))
 
-        size = list(self._render_font(params).get_size())
         size[1]= max(size[1],self.font_object.get_ascent() - self.font_object.get_descent())
         if not self.show_text_outline:
             return size
@@ -233,31 +294,140 @@ class TextWidget(Widget):
     def get_text(self) -> str:
         return self.text
 
+    def _setup_font(self) -> tuple:
+        """
+        Applies the widget style to the shared font object, returns the old settings
+        """
+        font = self.font_object
+        old = (font.get_italic(), font.get_bold(), font.get_underline(), font.align)
+        font.set_italic(self.is_italic)
+        font.set_bold(self.is_bold)
+        font.set_underline(self.is_underlined)
+        font.align = self.line_alignment
+        return old
+
+    def _reset_font(self, old: tuple) -> None:
+        font = self.font_object
+        font.set_italic(old[0])
+        font.set_bold(old[1])
+        font.set_underline(old[2])
+        font.align = old[3]
+
     def _render_font(self, params: dict) -> pygame.Surface:
         params.pop("font_name")
-        # save old settings
-        old_italic = self.font_object.get_italic()
-        old_bold = self.font_object.get_bold()
-        old_underline = self.font_object.get_underline()
-        old_align = self.font_object.align
-        # setup font
-        self.font_object.set_italic(self.is_italic)
-        self.font_object.set_bold(self.is_bold)
-        self.font_object.set_underline(self.is_underlined)
-        self.font_object.align = self.line_alignment
+        old = self._setup_font()
         surf = self.font_object.render(**params)
-        # reset font
-        self.font_object.set_italic(old_italic)
-        self.font_object.set_bold(old_bold)
-        self.font_object.set_underline(old_underline)
-        self.font_object.align = old_align
+        self._reset_font(old)
         return surf
 
+    def _get_line_bgcolor(self):
+        return self.text_bg_color if not self.show_text_outline else None
+
+    def _get_line_cache_key(self, bgcolor) -> tuple:
+        return (
+            self.font_object, self.antialias, self.text_color, bgcolor,
+            self.is_italic, self.is_bold, self.is_underlined,
+        )
+
+    def _get_line_surfaces(self, lines: list[str], bgcolor) -> list[pygame.Surface]:
+        """
+        Returns the rendered lines, only rendering those not in the cache
+        """
+        key = self._get_line_cache_key(bgcolor)
+        cache = self._line_cache
+        if key != self._line_cache_key or len(cache) > 2 * len(lines) + 256:
+            cache.clear()
+            self._line_cache_key = key
+        surfaces = list(map(cache.get, lines))
+        if None not in surfaces:
+            return surfaces
+        old = self._setup_font()
+        for i, surface in enumerate(surfaces):
+            if surface is None:
+                line = lines[i]
+                if line not in cache:
+                    cache[line] = self.font_object.render(line, self.antialias, self.text_color, bgcolor)
+                surfaces[i] = cache[line]
+        self._reset_font(old)
+        return surfaces
+
+    def _get_line_x(self, line_width: int, width: int) -> int:
+        if self.line_alignment == pygame.FONT_CENTER:
+            return (width - line_width) // 2
+        if self.line_alignment == pygame.FONT_RIGHT:
+            return width - line_width
+        return 0
+
+    def _paint_lines(self, surface: pygame.Surface, offset: tuple[float, float], bgcolor, fill_color) -> None:
+        """
+        Blits the cached lines visible on surface, the text being drawn at offset.
+        If only some lines changed since the last paint on the same surface, only their rows are painted again
+        """
+        lines = self.get_lines()
+        surfaces = self._get_line_surfaces(lines, bgcolor)
+        linesize = self.font_object.get_linesize()
+        width = max(map(pygame.Surface.get_width, surfaces))
+
+        state = (surface, tuple(offset), width, self._line_cache_key, self.line_alignment, fill_color)
+        old_lines = self._painted_lines
+        first, last = 0, len(lines)
+        if old_lines is not None and state == self._painted_state:
+            count = min(len(old_lines), len(lines))
+            while first < count and old_lines[first] == lines[first]:
+                first += 1
+            if len(old_lines) == len(lines):
+                while last > first and old_lines[last - 1] == lines[last - 1]:
+                    last -= 1
+            else:  # following lines moved
+                last = max(len(old_lines), len(lines))
+            surface.fill(fill_color, (0, offset[1] + first * linesize, surface.get_width(), (last - first) * linesize))
+        else:
+            surface.fill(fill_color)
+        self._painted_lines = lines
+        self._painted_state = state
+
+        first = max(first, int(-offset[1] // linesize))
+        last = min(last, len(lines), int((surface.get_height() - offset[1]) // linesize) + 1)
+        if first >= last:
+            return
+        surface.fblits(
+            [
+                (s, (offset[0] + self._get_line_x(s.get_width(), width), offset[1] + i * linesize))
+                for i, s in zip(range(first, last), surfaces[first:last])
+            ]
+        )
+
     def _get_outline_offset(self)->tuple[int,int]:
         mask_size = self._text_outline_mask.get_size()
         return  mask_size[0]//2,mask_size[1]//2
 
 
+    def _resize_surface(self) -> bool:
+        """
+        returns True if size changed
+        """
+        new_size = tuple(max(0, int(i)) for i in self.rect.size)
+        if self.surface.get_size() == new_size:
+            return False
+        buffer = self._surface_buffer
+        if (
+            buffer is None
+            or buffer.get_width() < new_size[0] or buffer.get_height() < new_size[1]
+            or buffer.get_width() > new_size[0] * 2 + 64 or buffer.get_height() > new_size[1] * 2 + 64
+            or bool(buffer.get_flags() & pygame.SRCALPHA) != self.convert_alpha
+        ):
+            # leave room to grow
+            buffer = pygame.Surface(
+                (new_size[0] + new_size[0] // 4 + 16, new_size[1] + new_size[1] // 4 + 16), self.surface_flags
+            )
+            if self.convert_alpha:
+                buffer = buffer.convert_alpha()
+            self._surface_buffer = buffer
+        old_alpha = self.surface.get_alpha()
+        self.surface = buffer.subsurface((0, 0, *new_size))
+        self.surface.set_alpha(old_alpha)
+        return True
+
     def build(self) -> bool:
         """
         return True if size changed
@@ -277,23 +447,35 @@ class TextWidget(Widget):
             return
         
             
-        wrap = int(self.get_inner_width()) if self.auto_wraplength and not self.autoresize_w else 0
+        wrap = self._get_wraplength()
         params = {
             "font_name": self.font_object.name,
-            "text": self.text,
             "antialias": self.antialias,
             "color": self.text_color,
             "bgcolor": self.text_bg_color if not self.show_text_outline else None,
             "wraplength": wrap,
         }
 
-        if self.text_bg_color is None : 
+        if self.text_bg_color is None and not self.surface.get_flags() & pygame.SRCALPHA:
             self.surface = self.surface.convert_alpha()
 
         bg_fill_color = (0, 0, 0, 0) if self.text_bg_color is None else  self.text_bg_color 
-        self.surface.fill(bg_fill_color)
 
-        text_surf = self._render_font(params)
+        if not wrap and not self.show_text_outline:
+            self._paint_lines(self.surface, -self.scroll, params["bgcolor"], bg_fill_color)
+            return
+
+        self._painted_lines = None
+        self.surface.fill(bg_fill_color)
+        if not wrap:
+            size = self.get_min_required_size()
+            offset = self._get_outline_offset()
+            text_surf = pygame.Surface((size[0] - offset[0] * 2, size[1] - offset[1] * 2), pygame.SRCALPHA)
+            self._paint_lines(text_surf, (0, 0), None, (0, 0, 0, 0))
+            self._painted_lines = None
+        else:
+            params["text"] = self.text
+            text_surf = self._render_font(params)
 
         if self.show_text_outline:
             mask = pygame.mask.from_surface(text_surf).convolve(self._text_outline_mask)
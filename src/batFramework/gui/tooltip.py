@@ -13,6 +13,9 @@ class ToolTip(Label):
     def __str__(self):
         return f"ToolTip('{self.text_widget.text}')"
 
+    hit_testable = False
+    indexed = False  # drawn by Root itself, moves every frame
+
     def top_at(self, x, y):
         return None
 
@@ -22,14 +25,20 @@ class ToolTip(Label):
 
     def fade_in(self):
         self.set_visible(True)
-        bf.PropertyEaser(
-            self.fade_in_duration,bf.easing.EASE_OUT,
-            0,self.parent_scene.name
-        ).add_custom(self.get_alpha,self.set_all_alpha,255).start()
+        bf.TweenManager().tween(
+            self, "alpha", 255, self.fade_in_duration, bf.easing.EASE_OUT,
+            self.parent_scene.name, getter=self.get_alpha, setter=self.set_all_alpha,
+        )
 
     def fade_out(self):
-        bf.PropertyEaser(
-            self.fade_out_duration,bf.easing.EASE_IN,
-            0,self.parent_scene.name,
-            lambda : self.set_visible(False)
-        ).add_custom(self.get_alpha,self.set_all_alpha,0).start()
+        if not self.visible:
+            return
+        tween = bf.TweenManager().tween(
+            self, "alpha", 0, self.fade_out_duration, bf.easing.EASE_IN,
+            self.parent_scene.name, self._hide, getter=self.get_alpha, setter=self.set_all_alpha,
+        )
+        if tween is None:  # already transparent
+            self.set_visible(False)
+
+    def _hide(self):
+        self.set_visible(False)
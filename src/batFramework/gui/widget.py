@@ -17,6 +17,21 @@ class WidgetMeta(type):
 
 
 class Widget(bf.Drawable, metaclass=WidgetMeta):
+    # on the top widget of a tree (its Root) : increased when a widget of the tree moves, resizes,
+    # shows/hides or when children change (see Root hover tracking and draw list)
+    tree_version: int = 0
+    # False if top_at never returns the widget nor its children
+    hit_testable: bool = True
+    # False if the widget and its children are neither in the hit index nor in the draw list of their Root
+    # (their changes don't outdate them)
+    indexed: bool = True
+    # bulk building (see Root.batch) : parents whose children still need their layer and scene
+    _batch_depth: int = 0
+    _batched_parents: dict["Widget", None] = {}
+    parent: "Widget" = None  # class default, some widgets set flags before Widget.__init__
+    # containers caching their render (see Container.set_render_cache), nothing to invalidate while there are none
+    _render_caches: int = 0
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.children: list["Widget"] = []
@@ -49,9 +64,85 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
         self.visit(lambda w: w.set_visible(False))
         return self
 
+    def _tree_changed(self) -> None:
+        widget = self
+        while widget.parent is not None:
+            if not widget.indexed:
+                return
+            widget = widget.parent
+        widget.tree_version += 1
+
+    def _render_changed(self) -> None:
+        """
+        The widget looks different, moved or was shown/hidden : the renders cached by it and its ancestors are outdated
+        """
+        if not Widget._render_caches:
+            return
+        widget = self
+        while widget is not None:
+            widget.dirty_render_cache = True
+            widget = widget.parent
+
+    def set_alpha(self, alpha: int) -> Self:
+        self._render_changed()
+        return super().set_alpha(alpha)
+
+    @property
+    def dirty_shape(self) -> bool:
+        return self._dirty_shape
+
+    @dirty_shape.setter
+    def dirty_shape(self, value: bool) -> None:
+        self._dirty_shape = value
+        if value:
+            self._min_size_changed()
+
+    def _min_size_changed(self) -> None:
+        """
+        Forgets the memoized min sizes that may depend on this widget (its own and its ancestors').
+        Stops above an ancestor that had already forgotten it : the ones above didn't use it since
+        """
+        self._forget_min_size()
+        parent = self.parent
+        while parent is not None and parent._forget_min_size():
+            parent = parent.parent
+
+    def _forget_min_size(self) -> bool:
+        """
+        Returns False if the widget memoizes its min size and it was already forgotten
+        """
+        return True
+
+    @staticmethod
+    def _begin_batch() -> None:
+        Widget._batch_depth += 1
+
+    @staticmethod
+    def _end_batch() -> None:
+        """
+        Gives the widgets added during the batch their parent's layer and scene.
+        Each subtree is visited once : children already up to date are skipped
+        """
+        Widget._batch_depth -= 1
+        if Widget._batch_depth:
+            return
+        parents, Widget._batched_parents = Widget._batched_parents, {}
+        for parent in parents:
+            for child in parent.children:
+                if child.parent_layer is not parent.parent_layer:
+                    child.set_parent_layer(parent.parent_layer)
+                if child.parent_scene is not parent.parent_scene:
+                    child.set_parent_scene(parent.parent_scene)
+            parent.do_sort_children = True
+            if parent.parent:
+                parent.parent.do_sort_children = True
+
     def set_visible(self, value):
-        if self.visible != value and value==True:
-            self.dirty_surface = True
+        if self.visible != value:
+            self._tree_changed()
+            self._render_changed()
+            if value:
+                self.dirty_surface = True
         return super().set_visible(value)
 
     def kill(self):
@@ -65,8 +156,13 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
     def set_clip_children(self, value: bool) -> Self:
         self.clip_children = value
         self.dirty_surface = True
+        self._tree_changed()
         return self
 
+    def set_blit_flags(self, blit_flags: int) -> Self:
+        self._tree_changed()
+        return super().set_blit_flags(blit_flags)
+
     def __str__(self) -> str:
         return "Widget"
 
@@ -110,6 +206,8 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
             return self
         dx, dy = x - self.rect.x, y - self.rect.y
         self.rect.topleft = x, y
+        self._tree_changed()
+        self._render_changed()
         _ = [c.set_position(c.rect.x + dx, c.rect.y + dy) for c in self.children]
         self.dirty_position_constraints: bool = True
         return self
@@ -123,6 +221,8 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
             return self
         dx, dy = x - self.rect.centerx, y - self.rect.centery
         self.rect.center = x, y
+        self._tree_changed()
+        self._render_changed()
         _ = [
             c.set_center(c.rect.centerx + dx, c.rect.centery + dy)
             for c in self.children            
@@ -167,6 +267,8 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
         else:
             self.padding = (value,) * 4
 
+        self._tree_changed()  # inner rect changed : children clip (hit index, draw list)
+        self._render_changed()
         self.dirty_shape = True
         return self
 
@@ -353,9 +455,29 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
                     
         return self if self.visible and self.rect.collidepoint(x, y) else None
 
+    _indexed_top_at = top_at  # the top_at that _add_hit_entries mirrors
+
+    def _add_hit_entries(self, index, clip: pygame.FRect | None) -> None:
+        """
+        Adds the widget and its children to a HitIndex, in the order top_at tests them (reversed)
+        """
+        index.add(self, self.rect.clip(clip) if clip is not None else self.rect.copy())
+        for child in self.children:
+            index.add_tree(child, clip)
+
     def add(self, *children: "Widget") -> Self:
         self.children.extend(children)
+        self._tree_changed()
+        self._render_changed()
         i = len(self.children)
+        if Widget._batch_depth:
+            for child in children:
+                if child.render_order == 0:
+                    child.render_order = i + 1
+                child.set_parent(self)
+                i += 1
+            Widget._batched_parents[self] = None
+            return self
         for child in children:
             if child.render_order == 0:
                 child.set_render_order(i+1)
@@ -374,6 +496,8 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
                 child.set_parent_scene(None)
                 child.set_parent_layer(None)
                 self.children.remove(child)
+                self._tree_changed()
+                self._render_changed()
         if self.parent:
             self.parent.do_sort_children = True
 
@@ -391,6 +515,8 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
             size[1] = self.rect.h
         if size[0] == self.rect.w and size[1] == self.rect.h : return self
         self.rect.size = size
+        self._tree_changed()
+        self._render_changed()
         self.dirty_shape = True
         return self
 
@@ -404,6 +530,8 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
         if self.do_sort_children:
             self.children.sort(key=lambda c: c.render_order)
             self.do_sort_children = False
+            self._tree_changed()
+            self._render_changed()
         _ = [c.update(dt) for c in self.children]
         super().update(dt)
 
@@ -526,6 +654,7 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
         if self.dirty_surface and not skip_draw:
             self.paint()
             self.dirty_surface = False
+            self._render_changed()  # the new surface shows from now on
 
 
     def draw(self, camera: bf.Camera) -> None:
@@ -544,3 +673,16 @@ class Widget(bf.Drawable, metaclass=WidgetMeta):
                 child.draw(camera)
         if self.clip_children:
             camera.surface.set_clip(old_clip)
+
+    _flat_draw = draw  # the draw that _add_draw_entries mirrors
+
+    def _add_draw_entries(self, draw_list, clip) -> None:
+        """
+        Adds the widget and its children to a DrawList, in the order draw blits them
+        """
+        draw_list.add(self, clip)
+        if self.clip_children:
+            clip = draw_list.camera.world_to_screen(self.get_inner_rect()).clip(clip)
+        for child in self.children:
+            if (not self.clip_children) or (child.rect.colliderect(self.rect) or not child.rect):
+                draw_list.add_tree(child, clip)
@@ -0,0 +1,161 @@
+import marshal
+import random
+import struct
+import time
+import pygame
+import batFramework as bf
+
+MAGIC = b"BFIR"
+VERSION = 2
+_HEADER = struct.Struct("<4sBQ")  # magic, version, random seed
+_FRAME = struct.Struct("<dhhBHH")  # dt, mouse x, mouse y, mouse buttons (bit per button), pressed key count, event count
+_EVENT = struct.Struct("<IH")  # event type, payload size
+_KEY = struct.Struct("<H")
+
+
+def _serializable(value) -> bool:
+    if isinstance(value, (int, float, str, bool, type(None))):
+        return True
+    if isinstance(value, (tuple, list)):
+        return all(_serializable(v) for v in value)
+    return False
+
+
+class InputRecorder:
+    """
+    Writes the events, keyboard state, mouse position and buttons and dt of every frame to a binary log.
+    Event attributes that can't be stored (window objects...) are dropped.
+    While recording, the global random module is seeded with the stored seed, so a replay draws the same numbers.
+    Its previous state is given back on close.
+    """
+
+    def __init__(self, path: str, seed: int | None = None) -> None:
+        self.path = path
+        self.seed: int = seed if seed is not None else random.SystemRandom().getrandbits(63)
+        self.frame_count: int = 0
+        self._events: list[pygame.Event] = []
+        self._keys: list[int] = []
+        self._mouse_pos: tuple[int, int] = (0, 0)
+        self._mouse_buttons: int = 0
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self.seed))
+        self._random_state = random.getstate()
+        random.seed(self.seed)
+
+    def record_events(self, events: list[pygame.Event], state: "bf.InputState") -> None:
+        """
+        Called with the events of the frame and the input state taken with them
+        """
+        self._events.extend(events)
+        # pressed scancodes (ScancodeWrapper forbids iteration, its tuple content is per scancode)
+        self._keys = [i for i, pressed in enumerate(tuple.__iter__(state.get_keys())) if pressed]
+        self._mouse_pos = state.get_mouse_pos()
+        self._mouse_buttons = sum(1 << i for i, pressed in enumerate(state.get_mouse_pressed(5)) if pressed)
+
+    def end_frame(self, dt: float) -> None:
+        x, y = self._mouse_pos
+        write = self._file.write
+        write(_FRAME.pack(dt, x, y, self._mouse_buttons, len(self._keys), len(self._events)))
+        for key in self._keys:
+            write(_KEY.pack(key))
+        for event in self._events:
+            payload = marshal.dumps(
+                {k: v for k, v in event.dict.items() if _serializable(v)}
+            )
+            write(_EVENT.pack(event.type, len(payload)))
+            write(payload)
+        self._events.clear()
+        self.frame_count += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+            random.setstate(self._random_state)
+
+
+class InputReplayer:
+    """
+    Reads a log written by InputRecorder and gives back each frame's inputs.
+    Also measures how long each replayed frame took (frame_times, in seconds),
+    to compare profiles of the same session across builds.
+    Like the recorder, seeds the global random module with the session seed until close.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as f:
+            self._data = f.read()
+        magic, version, self.seed = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"'{path}' is not an input log (or was written by another version)")
+        self._offset = _HEADER.size
+        self.frame_dt: float = 0.0
+        self.keys = None
+        self.mouse_buttons: tuple[bool, ...] = (False,) * 5
+        self.mouse_pos: tuple[int, int] = (0, 0)
+        self.frame_times: list[float] = []
+        self._frame_start: float | None = None
+        self._random_state = random.getstate()
+        random.seed(self.seed)
+
+    def close(self) -> None:
+        """
+        Gives the random module its state from before the replay back
+        """
+        if self._random_state is not None:
+            random.setstate(self._random_state)
+            self._random_state = None
+
+    @property
+    def done(self) -> bool:
+        return self._offset >= len(self._data)
+
+    def next_frame(self) -> list[pygame.Event] | None:
+        """
+        Returns the events of the next frame (None when the log is over).
+        Sets frame_dt, keys (a ScancodeWrapper), mouse_buttons and mouse_pos, and moves the mouse to its recorded position
+        """
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.frame_times.append(now - self._frame_start)
+        self._frame_start = now
+        if self.done:
+            return None
+        data = self._data
+        self.frame_dt, x, y, buttons, key_count, event_count = _FRAME.unpack_from(data, self._offset)
+        self._offset += _FRAME.size
+        self.mouse_buttons = tuple(bool(buttons & (1 << i)) for i in range(5))
+        self.mouse_pos = (x, y)
+
+        pressed = [False] * len(pygame.key.get_pressed())
+        for _ in range(key_count):
+            (key,) = _KEY.unpack_from(data, self._offset)
+            self._offset += _KEY.size
+            if key < len(pressed):
+                pressed[key] = True
+        self.keys = pygame.key.ScancodeWrapper(pressed)
+
+        events = []
+        for _ in range(event_count):
+            event_type, size = _EVENT.unpack_from(data, self._offset)
+            self._offset += _EVENT.size
+            attributes = marshal.loads(data[self._offset:self._offset + size])
+            self._offset += size
+            events.append(pygame.Event(event_type, attributes))
+
+        if pygame.mouse.get_pos() != (x, y):
+            pygame.mouse.set_pos(x, y)
+        pygame.event.clear()  # drop real inputs (and the motion caused by set_pos)
+        return events
+
+    def get_summary(self) -> str:
+        times = sorted(self.frame_times)
+        if not times:
+            return "no frame replayed"
+        mean = sum(times) / len(times)
+        return (
+            f"{len(times)} frames | mean {mean * 1000:.2f} ms | "
+            f"median {times[len(times) // 2] * 1000:.2f} ms | "
+            f"p99 {times[min(len(times) - 1, int(len(times) * 0.99))] * 1000:.2f} ms | "
+            f"max {times[-1] * 1000:.2f} ms"
+        )
@@ -0,0 +1,157 @@
+import pygame
+import batFramework as bf
+from typing import Callable, Sequence
+
+
+class InputSnapshot:
+    """
+    State of the inputs for the current frame, taken once per frame by the InputRouter.
+    Read it instead of tracking raw events in every entity.
+    """
+
+    def __init__(self) -> None:
+        self.keys: Sequence[bool] = ()  # bf.InputState keyboard state
+        self.mouse_pos: tuple[int, int] = (0, 0)
+        self.mouse_world_pos: tuple[float, float] = (0, 0)
+        self.mouse_buttons: tuple[bool, ...] = (False, False, False)
+        self.actions: frozenset[str] = frozenset()  # names of the active router actions
+
+    def take(self, actions: bf.ActionContainer, camera: bf.Camera | None = None) -> None:
+        state = bf.InputState()
+        self.keys = state.get_keys()
+        self.mouse_pos = state.get_mouse_pos()
+        self.mouse_world_pos = camera.screen_to_world(self.mouse_pos) if camera else self.mouse_pos
+        self.mouse_buttons = state.get_mouse_pressed()
+        self.actions = frozenset(action.name for action in actions if action.active)
+
+    def is_pressed(self, key: int) -> bool:
+        return key < len(self.keys) and bool(self.keys[key])
+
+    def is_action_active(self, *names: str) -> bool:
+        return self.actions.issuperset(names)
+
+
+class InputRouter:
+    """
+    Gives events only to the entities that subscribed to their type.
+    Entities are subscribed when added to the layer (to their event_types, or to every event if empty),
+    unless they don't handle events at all (process_event, process_actions and handle_event not overriden).
+    Shared actions can be set on the router : they are processed once per event,
+    and callbacks can subscribe to their activation.
+    """
+
+    def __init__(self) -> None:
+        self.actions: bf.ActionContainer = bf.ActionContainer()
+        self.snapshot: InputSnapshot = InputSnapshot()
+        self._subscribers: dict[int | None, dict[int, bf.Entity]] = {}  # event type (None for all) -> uid -> entity
+        self._subscriptions: dict[int, tuple] = {}  # uid -> event types
+        self._order: dict[int, int] = {}  # uid -> subscription order
+        self._seq: int = 0
+        self._action_callbacks: dict[str, list[Callable[[bf.Action], None]]] = {}
+
+    def __contains__(self, entity) -> bool:
+        return entity.uid in self._subscriptions
+
+    @staticmethod
+    def handles_events(entity) -> bool:
+        """
+        Returns False if the entity does nothing with events
+        """
+        base = bf.LightEntity if isinstance(entity, bf.LightEntity) else bf.Entity
+        cls = type(entity)
+        return any(
+            getattr(cls, name) is not getattr(base, name) or name in getattr(entity, "__dict__", ())
+            for name in ("process_event", "process_actions", "handle_event")
+        )
+
+    def subscribe(self, entity, *event_types: int) -> None:
+        """
+        Entity will receive events of the given types (all events if no type is given).
+        Replaces its previous subscription
+        """
+        self.unsubscribe(entity)
+        types = event_types or (None,)
+        self._subscriptions[entity.uid] = types
+        self._order[entity.uid] = self._seq
+        self._seq += 1
+        for event_type in types:
+            self._subscribers.setdefault(event_type, {})[entity.uid] = entity
+
+    def unsubscribe(self, entity) -> None:
+        types = self._subscriptions.pop(entity.uid, None)
+        if types is None:
+            return
+        self._order.pop(entity.uid, None)
+        for event_type in types:
+            subscribers = self._subscribers[event_type]
+            subscribers.pop(entity.uid, None)
+            if not subscribers:
+                del self._subscribers[event_type]
+
+    def subscribe_action(self, name: str, callback: Callable[[bf.Action], None]) -> None:
+        """
+        Callback is called with the action when the router action of that name is activated by an event
+        """
+        self._action_callbacks.setdefault(name, []).append(callback)
+
+    def unsubscribe_action(self, name: str, callback: Callable[[bf.Action], None]) -> None:
+        callbacks = self._action_callbacks.get(name)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+
+    def get_event_types(self) -> set[int]:
+        """
+        Returns the event types entities explicitly subscribed to, and those used by the router actions
+        """
+        used = {t for t in self._subscribers if t is not None}
+        return used.union(self.actions.get_event_types())
+
+    def add_entity(self, entity) -> None:
+        """
+        Subscribes a newly added entity according to its event_types
+        """
+        if self.handles_events(entity):
+            self.subscribe(entity, *entity.event_types)
+
+    def process_event(self, event: pygame.Event) -> None:
+        if event.consumed:
+            return
+        if self.actions.get_all():
+            self._process_actions(event)
+            if event.consumed:
+                return
+        all_events = self._subscribers.get(None)
+        typed = self._subscribers.get(event.type)
+        if typed and all_events:
+            order = self._order
+            entities = sorted((*all_events.values(), *typed.values()), key=lambda e: order[e.uid])
+        elif typed:
+            entities = list(typed.values())
+        elif all_events:
+            entities = list(all_events.values())
+        else:
+            return
+        for e in entities:
+            e.process_event(event)
+            if event.consumed:
+                return
+
+    def _process_actions(self, event: pygame.Event) -> None:
+        if not self._action_callbacks:
+            self.actions.process_event(event)
+            return
+        inactive = [a for a in self.actions if not a.active]
+        self.actions.process_event(event)
+        for action in inactive:
+            if action.active:
+                for callback in self._action_callbacks.get(action.name, ()):
+                    callback(action)
+
+    def update(self, camera: bf.Camera | None = None) -> None:
+        """
+        Takes the input snapshot of the frame
+        """
+        self.snapshot.take(self.actions, camera)
+
+    def reset(self) -> None:
+        self.actions.reset()
@@ -0,0 +1,40 @@
+import pygame
+from .utils import Singleton
+
+
+class InputState(metaclass=Singleton):
+    """
+    Keyboard and mouse state of the current frame, taken once per frame by the Manager
+    (or set from the log by an InputReplayer).
+    Read it instead of pygame.key.get_pressed() / pygame.mouse.get_pressed() so replays see the recorded state.
+    Until a Manager takes it, the devices are read directly.
+    """
+
+    def __init__(self) -> None:
+        self.keys: pygame.key.ScancodeWrapper | None = None
+        self.mouse_buttons: tuple[bool, ...] | None = None  # 5 buttons
+        self.mouse_pos: tuple[int, int] | None = None
+
+    def take(self) -> None:
+        """
+        Reads the devices (after the event queue was pumped)
+        """
+        self.keys = pygame.key.get_pressed()
+        self.mouse_buttons = pygame.mouse.get_pressed(5)
+        self.mouse_pos = pygame.mouse.get_pos()
+
+    def set(self, keys, mouse_buttons: tuple[bool, ...], mouse_pos: tuple[int, int]) -> None:
+        self.keys = keys
+        self.mouse_buttons = tuple(mouse_buttons)
+        self.mouse_pos = mouse_pos
+
+    def get_keys(self):
+        return self.keys if self.keys is not None else pygame.key.get_pressed()
+
+    def get_mouse_pressed(self, num_buttons: int = 3) -> tuple[bool, ...]:
+        if self.mouse_buttons is None:
+            return pygame.mouse.get_pressed(num_buttons)
+        return self.mouse_buttons[:num_buttons]
+
+    def get_mouse_pos(self) -> tuple[int, int]:
+        return self.mouse_pos if self.mouse_pos is not None else pygame.mouse.get_pos()
@@ -0,0 +1,291 @@
+from typing import Self
+import pygame
+import batFramework as bf
+from .entity import Entity
+
+
+class LightEntity:
+    """
+    Lightweight entity with a fixed set of attributes (no __dict__, no FRect).
+    Meant for large amounts of simple entities (props, bullets, crowds...).
+    Position and size are plain floats, or live in a TransformStore when bound to one.
+    The rect property returns a copy : use the setters to move the entity.
+    Uids are shared with Entity, but are not recycled when the entity is deleted.
+    """
+
+    __slots__ = (
+        "uid", "_x", "_y", "_w", "_h", "_store", "_index",
+        "tags", "parent_scene", "parent_layer", "debug_color",
+    )
+    event_types: tuple[int, ...] = ()  # event types given by the layer's InputRouter (empty means all)
+
+    def __init__(self, size: tuple[float, float] = (10, 10)) -> None:
+        self.uid: int = Entity.new_uid()
+        self._x: float = 0.0
+        self._y: float = 0.0
+        self._w: float = size[0]
+        self._h: float = size[1]
+        self._store: bf.TransformStore | None = None
+        self._index: int = -1
+        self.tags: set[str] | None = None  # created on first tag
+        self.parent_scene: bf.Scene | None = None
+        self.parent_layer: bf.SceneLayer | None = None
+        self.debug_color: tuple | str = "red"
+
+    # --- transform ---
+    @property
+    def x(self) -> float:
+        return self._x if self._store is None else self._store.x[self._index]
+
+    @property
+    def y(self) -> float:
+        return self._y if self._store is None else self._store.y[self._index]
+
+    @property
+    def w(self) -> float:
+        return self._w if self._store is None else self._store.w[self._index]
+
+    @property
+    def h(self) -> float:
+        return self._h if self._store is None else self._store.h[self._index]
+
+    @property
+    def rect(self) -> pygame.FRect:
+        if self._store is None:
+            return pygame.FRect(self._x, self._y, self._w, self._h)
+        return self._store.get_rect(self._index)
+
+    def set_position(self, x, y) -> Self:
+        if self._store is None:
+            self._x, self._y = x, y
+        else:
+            self._store.x[self._index] = x
+            self._store.y[self._index] = y
+        return self
+
+    def set_center(self, x, y) -> Self:
+        return self.set_position(x - self.w / 2, y - self.h / 2)
+
+    def move_by(self, x, y) -> Self:
+        return self.set_position(self.x + x, self.y + y)
+
+    def set_size(self, size: tuple[float, float]) -> Self:
+        if self._store is None:
+            self._w, self._h = size
+        else:
+            self._store.w[self._index] = size[0]
+            self._store.h[self._index] = size[1]
+        return self
+
+    def _bind_store(self, store: "bf.TransformStore | None") -> None:
+        if store is self._store:
+            return
+        x, y, w, h = self.x, self.y, self.w, self.h
+        if self._store is not None:
+            self._store.remove(self)
+        self._store = store
+        if store is not None:
+            self._index = store.add(self, x, y, w, h)
+            self._x = self._y = self._w = self._h = 0.0  # transform lives in the store
+        else:
+            self._index = -1
+            self._x, self._y, self._w, self._h = x, y, w, h
+
+    # --- same interface as Entity ---
+    def get_debug_outlines(self):
+        yield (self.rect, self.debug_color)
+
+    def set_debug_color(self, color) -> Self:
+        self.debug_color = color
+        return self
+
+    def kill(self):
+        """
+        Removes the entity from a scene layer
+        """
+        if self.parent_layer:
+            self.parent_layer.remove(self)
+
+    def set_parent_layer(self, layer):
+        self.parent_layer = layer
+        self._bind_store(layer.transform_store if layer is not None else None)
+
+    def set_parent_scene(self, scene) -> Self:
+        if scene == self.parent_scene:
+            return self
+        if self.parent_scene is not None:
+            self.do_when_removed()
+        self.parent_scene = scene
+        if scene is not None:
+            self.do_when_added()
+        else:  # removed from its layer
+            self._bind_store(None)
+        return self
+
+    def do_when_added(self):
+        pass
+
+    def do_when_removed(self):
+        pass
+
+    def add_tags(self, *tags) -> Self:
+        if self.tags is None:
+            self.tags = set()
+        new_tags = set(tags).difference(self.tags)
+        if new_tags:
+            self.tags.update(new_tags)
+            if self.parent_layer:
+                self.parent_layer.index_tags(self, new_tags)
+        return self
+
+    def remove_tags(self, *tags):
+        if not self.tags:
+            return
+        old_tags = self.tags.intersection(tags)
+        if old_tags:
+            self.tags.difference_update(old_tags)
+            if self.parent_layer:
+                self.parent_layer.unindex_tags(self, old_tags)
+
+    def has_tags(self, *tags) -> bool:
+        """
+        return True if entity contains all given tags
+        """
+        if not self.tags:
+            return not tags
+        return self.tags.issuperset(tags)
+
+    def has_any_tags(self, *tags) -> bool:
+        """
+        return True if entity contains any of given tags
+        """
+        return bool(self.tags) and not self.tags.isdisjoint(tags)
+
+    def get_tags(self) -> list[str]:
+        return sorted(self.tags) if self.tags else []
+
+    def process_event(self, event: pygame.Event) -> None:
+        if event.consumed:
+            return
+        self.process_actions(event)
+        self.handle_event(event)
+
+    def process_actions(self, event: pygame.Event) -> None:
+        """
+        Process entity actions you may have set
+        """
+
+    def reset_actions(self) -> None:
+        """
+        Reset entity actions you may have set
+        """
+
+    def handle_event(self, event: pygame.Event):
+        """
+        Handle specific events with no action support
+        """
+        return False
+
+    def update(self, dt: float) -> None:
+        """
+        Update method to be overriden by subclasses (must call do_update and reset_actions)
+        """
+        self.do_update(dt)
+        self.reset_actions()
+
+    def do_update(self, dt: float) -> None:
+        """
+        Update method to be overriden for specific behavior by the end user
+        """
+
+
+class LightDrawable(LightEntity):
+    """
+    Lightweight counterpart of Drawable.
+    The surface is not owned : many LightDrawables can share the same one.
+    When its layer has a TransformStore, the drawable is bound to it and drawn in bulk by the layer.
+    It can also be added to a RenderGroup, which then draws it instead of the store.
+    """
+
+    __slots__ = ("surface", "visible", "render_order", "blit_flags", "drawn_by_group", "render_group")
+
+    def __init__(self, surface: pygame.Surface | None = None, size: tuple[float, float] | None = None) -> None:
+        if size is None:
+            size = surface.get_size() if surface is not None else (10, 10)
+        super().__init__(size)
+        self.surface: pygame.Surface | None = surface
+        self.visible: bool = True
+        self.render_order: int = 0
+        self.blit_flags: int = 0
+        self.drawn_by_group: bool = False
+        self.render_group: bf.RenderGroup | None = None
+
+    def set_surface(self, surface: pygame.Surface) -> Self:
+        self.surface = surface
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def set_position(self, x, y) -> Self:
+        super().set_position(x, y)
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def set_size(self, size: tuple[float, float]) -> Self:
+        super().set_size(size)
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def set_blit_flags(self, blit_flags: int) -> Self:
+        self.blit_flags = blit_flags
+        return self
+
+    def set_visible(self, value: bool) -> Self:
+        self.visible = value
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def set_render_order(self, render_order: int) -> Self:
+        self.render_order = render_order
+        if self._store is not None:
+            self._store.dirty_order = True
+        elif self.parent_layer:
+            self.parent_layer.update_draw_order()
+        if self.render_group:
+            self.render_group.refresh_member(self)
+        return self
+
+    def set_parent_scene(self, scene) -> Self:
+        # entities removed from their scene leave their render group
+        if scene is None and self.parent_scene is not None and self.render_group:
+            self.render_group.remove(self)
+        return super().set_parent_scene(scene)
+
+    def get_debug_outlines(self):
+        if self.visible:
+            yield (self.rect, self.debug_color)
+
+    def _bind_store(self, store: "bf.TransformStore | None") -> None:
+        super()._bind_store(store)
+        self.drawn_by_group = store is not None or self.render_group is not None
+
+    def _set_render_group(self, group: "bf.RenderGroup | None") -> None:
+        self.render_group = group
+        self.drawn_by_group = group is not None or self._store is not None
+
+    def draw(self, camera: bf.Camera) -> None:
+        """
+        Draw the entity onto the camera surface
+        """
+        if not self.visible or self.drawn_by_group or self.surface is None:
+            return
+        world_rect = camera.world_rect
+        x, y = self.x, self.y
+        if x >= world_rect.right or y >= world_rect.bottom or x + self.w <= world_rect.left or y + self.h <= world_rect.top:
+            return
+        camera.surface.blit(
+            self.surface, (x - world_rect.left, y - world_rect.top), special_flags=self.blit_flags
+        )
@@ -2,9 +2,32 @@ import batFramework as bf
 from batFramework import const
 import pygame
 import asyncio
+import logging
+import os
+from .inputRecorder import InputRecorder, InputReplayer
+
+logger = logging.getLogger(__name__)
 
 
 class Manager(bf.SceneManager):
+    # window events of which only the last one of a frame is dispatched
+    COALESCED_EVENTS = {
+        pygame.VIDEORESIZE, pygame.VIDEOEXPOSE, pygame.WINDOWRESIZED,
+        pygame.WINDOWSIZECHANGED, pygame.WINDOWMOVED, pygame.WINDOWEXPOSED,
+    }
+    # device events nothing in the framework uses, see block_unused_events
+    OPTIONAL_EVENTS = (
+        pygame.JOYAXISMOTION, pygame.JOYBALLMOTION, pygame.JOYHATMOTION,
+        pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP, pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED,
+        pygame.CONTROLLERAXISMOTION, pygame.CONTROLLERBUTTONDOWN, pygame.CONTROLLERBUTTONUP,
+        pygame.CONTROLLERDEVICEADDED, pygame.CONTROLLERDEVICEREMOVED, pygame.CONTROLLERDEVICEREMAPPED,
+        pygame.CONTROLLERTOUCHPADDOWN, pygame.CONTROLLERTOUCHPADMOTION, pygame.CONTROLLERTOUCHPADUP,
+        pygame.CONTROLLERSENSORUPDATE, pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+        pygame.MULTIGESTURE, pygame.AUDIODEVICEADDED, pygame.AUDIODEVICEREMOVED,
+        pygame.DROPFILE, pygame.DROPTEXT, pygame.DROPBEGIN, pygame.DROPCOMPLETE,
+        pygame.CLIPBOARDUPDATE, pygame.KEYMAPCHANGED, pygame.LOCALECHANGED,
+    )
+
     def __init__(self, *initial_scenes) -> None:
         super().__init__()
         self.debug_mode: bf.enums.debugMode = bf.debugMode.HIDDEN
@@ -15,6 +38,19 @@ class Manager(bf.SceneManager):
         self.clock: pygame.Clock = pygame.Clock()
         self.is_async_running : bool = False
         self.running = False
+        self.keys = None  # keyboard state of the frame, set by poll_events
+        self.recorder: InputRecorder | None = None
+        self.replayer: InputReplayer | None = None
+        self.replay_summary: str | None = None  # frame time statistics of the last replay
+        # device events no action uses are blocked after do_init, when run starts and when the scene changes
+        # (see block_unused_events). Set to False in do_pre_init to receive every event
+        self.auto_block_events: bool = True
+        self.kept_event_types: set[int] = set()  # event types read by handle_event overrides, never blocked
+        # sessions can be recorded/replayed without changing the game
+        if os.environ.get("BF_REPLAY_INPUT"):
+            self.start_replay(os.environ["BF_REPLAY_INPUT"])
+        elif os.environ.get("BF_RECORD_INPUT"):
+            self.start_recording(os.environ["BF_RECORD_INPUT"])
         pygame.mouse.set_cursor(bf.const.DEFAULT_CURSOR)
         bf.ResourceManager().set_sharedVar("clock", self.clock)
         bf.ResourceManager().set_sharedVar("debug_mode", self.debug_mode)
@@ -23,6 +59,7 @@ class Manager(bf.SceneManager):
         if initial_scenes:
             self.init_scenes(*initial_scenes)
         self.do_init()
+        self._auto_block_events()
 
     @staticmethod
     def set_icon(path: str) -> None:
@@ -58,9 +95,133 @@ class Manager(bf.SceneManager):
     def stop(self) -> None:
         self.running = False
 
+    def start_recording(self, path: str) -> None:
+        """
+        Records the inputs and dt of every frame to the file until stop_recording or the end of run
+        """
+        self.stop_recording()
+        self.recorder = InputRecorder(path)
+
+    def stop_recording(self) -> None:
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+
+    def start_replay(self, path: str) -> None:
+        """
+        Replaces real inputs and dt by the ones of a recorded session.
+        Frames are not capped to the fps limit, the run stops at the end of the log
+        and keeps frame time statistics in replay_summary (also logged at INFO level)
+        """
+        self.stop_replay()
+        self.replayer = InputReplayer(path)
+
+    def stop_replay(self) -> str | None:
+        """
+        Stops the replay, returns its frame time statistics
+        """
+        if self.replayer is None:
+            return None
+        self.replayer.close()
+        summary = self.replayer.get_summary()
+        logger.info("Replay %s : %s", self.replayer.path, summary)
+        self.replayer = None
+        return summary
+
+    def _end_replay(self) -> None:
+        self.replay_summary = self.stop_replay()
+        self.stop()
+
+    def poll_events(self) -> list[pygame.Event]:
+        """
+        Returns the events of the frame, ready to be dispatched.
+        Consecutive MOUSEMOTION events are merged into one (positions of the last, summed rel),
+        only the last event of each window event type is kept,
+        and the keyboard state is taken once for the whole frame.
+        """
+        if self.replayer is not None:
+            events = self.replayer.next_frame()
+            if events is None:
+                self._end_replay()
+                return []
+            bf.InputState().set(self.replayer.keys, self.replayer.mouse_buttons, self.replayer.mouse_pos)
+            self.keys = self.replayer.keys
+            return events
+
+        raw_events = pygame.event.get()
+        state = bf.InputState()
+        state.take()  # after the queue is pumped, to match the events
+        self.keys = state.keys
+        events: list[pygame.Event] = []
+        motion = None  # merged motion event, while motions are consecutive
+        window_events = False
+        for event in raw_events:
+            if event.type == pygame.MOUSEMOTION:
+                if motion is not None:
+                    rel = motion.rel[0] + event.rel[0], motion.rel[1] + event.rel[1]
+                    motion = pygame.Event(pygame.MOUSEMOTION, {**event.dict, "rel": rel})
+                    events[-1] = motion
+                    continue
+                motion = event
+            else:
+                motion = None
+                if event.type in self.COALESCED_EVENTS:
+                    window_events = True
+            events.append(event)
+
+        if window_events:
+            seen = set()
+            for i in range(len(events) - 1, -1, -1):
+                event_type = events[i].type
+                if event_type in self.COALESCED_EVENTS:
+                    if event_type in seen:
+                        events[i] = None
+                    else:
+                        seen.add(event_type)
+            events = [e for e in events if e is not None]
+        if self.recorder is not None:
+            self.recorder.record_events(events, state)
+        return events
+
+    def get_used_event_types(self) -> set[int]:
+        """
+        Returns the event types used by the actions and input routers of all scenes
+        """
+        used = set()
+        for scene in self.scenes:
+            for container in (scene.actions, scene.early_actions):
+                used.update(container.get_event_types())
+            for layer in scene.scene_layers:
+                used.update(layer.input_router.get_event_types())
+        return used
+
+    def block_unused_events(self, *keep: int) -> None:
+        """
+        Blocks the device events (joystick, controller, touch, drop...) that no action or
+        input router subscription uses, so they never reach the event queue.
+        Event types handled directly in handle_event overrides must be given in keep.
+        Called automatically (see auto_block_events), call again after adding actions using such events
+        while the same scene is on.
+        """
+        used = self.get_used_event_types().union(keep)
+        blocked = [t for t in self.OPTIONAL_EVENTS if t not in used]
+        allowed = [t for t in self.OPTIONAL_EVENTS if t in used]
+        if blocked:
+            pygame.event.set_blocked(blocked)
+        if allowed:
+            pygame.event.set_allowed(allowed)
+
+    def _auto_block_events(self) -> None:
+        if self.auto_block_events:
+            self.block_unused_events(*self.kept_event_types)
+
+    def set_scene(self, scene_name, index=0, ignore_early: bool = False):
+        super().set_scene(scene_name, index, ignore_early)
+        self._auto_block_events()  # the new scene may have added actions
+
     def process_event(self, event: pygame.Event):
         event.consumed = False
-        keys = pygame.key.get_pressed()
+        keys = bf.InputState().get_keys()
         if (
             bf.const.ALLOW_DEBUG and
             keys[pygame.K_LCTRL]
@@ -79,13 +240,20 @@ class Manager(bf.SceneManager):
 
         if event.consumed: return
         
+        if event.type == bf.const.MUSIC_END_EVENT:
+            bf.AudioManager().on_music_end()
         super().process_event(event)
         if not event.consumed:
             if event.type == pygame.QUIT:
                 self.running = False
 
     def update(self, dt: float) -> None:
+        if self.replayer is not None:
+            dt = self.replayer.frame_dt
+        elif self.recorder is not None:
+            self.recorder.end_frame(dt)
         self.timeManager.update(dt)
+        bf.AudioManager().update(dt)
         self.cutsceneManager.update(dt)
         super().update(dt)
 
@@ -97,18 +265,22 @@ class Manager(bf.SceneManager):
             raise Exception("Error : Already running")
         self.is_async_running = True
         self.running = True
+        self._auto_block_events()  # actions may have been added since __init__
         dt: float = 0
         while self.running:
-            for event in pygame.event.get():
+            for event in self.poll_events():
                 self.process_event(event)
             # update
             self.update(dt)
             # render
             self.draw(self.screen)
             pygame.display.flip()
-            dt = self.clock.tick(bf.const.FPS) / 1000
+            dt = self.clock.tick(0 if self.replayer else bf.const.FPS) / 1000
             dt = min(dt, 0.02) # dirty fix for dt being too high when window not focused for a long time
             await asyncio.sleep(0)
+        self.stop_recording()
+        if self.replayer is not None:  # stopped before the end of the log
+            self.replay_summary = self.stop_replay()
         pygame.quit()
 
     def run_async(self):
@@ -120,15 +292,19 @@ class Manager(bf.SceneManager):
         if self.running:
             raise Exception("Error : Already running")
         self.running = True
+        self._auto_block_events()  # actions may have been added since __init__
         dt: float = 0
         while self.running:
-            for event in pygame.event.get():
+            for event in self.poll_events():
                 self.process_event(event)
             # update
             self.update(dt)
             # render
             self.draw(self.screen)
             pygame.display.flip()
-            dt = self.clock.tick(bf.const.FPS) / 1000
+            dt = self.clock.tick(0 if self.replayer else bf.const.FPS) / 1000
             dt = min(dt, 0.02) # fix for dt being too high when window not focused for a long time
+        self.stop_recording()
+        if self.replayer is not None:  # stopped before the end of the log
+            self.replay_summary = self.stop_replay()
         pygame.quit()
@@ -1,34 +1,70 @@
 from .easingController import EasingController
 import pygame
+from array import array
 from typing import Callable, Any, Self
 import batFramework as bf
 
 class PropertyEaser(EasingController):
+    """
+    Eases properties from their start value to an end value.
+    Property types are checked once when added : numeric properties are interpolated
+    together from arrays of start values and deltas, vectors and colors one by one.
+    """
+    NUMBER = 0
+    VECTOR = 1
+    COLOR = 2
+
     class EasedProperty:
-        def __init__(self, getter: Callable[[], Any], setter: Callable[[Any], None], end_value: Any, start_value: Any = None):
+        def __init__(
+            self,
+            getter: Callable[[], Any],
+            setter: Callable[[Any], None],
+            end_value: Any,
+            start_value: Any = None,
+            obj: Any = None,
+            attr: str | None = None,
+        ):
             self.getter = getter
             self.setter = setter
+            self.obj = obj  # set with attr for properties added through add_attr
+            self.attr = attr
             self.start_value = start_value if start_value is not None else getter()
             self.end_value = end_value
-
-        def interpolate(self, t: float):
             a, b = self.start_value, self.end_value
             if isinstance(a, (int, float)):
-                return a + (b - a) * t
+                self.kind = PropertyEaser.NUMBER
+                self.delta = b - a
             elif isinstance(a, pygame.Vector2):
-                return a.lerp(b, t)
+                self.kind = PropertyEaser.VECTOR
+                self.delta = None
             elif isinstance(a, pygame.Color):
-                return pygame.Color(
-                    round(a.r + (b.r - a.r) * t),
-                    round(a.g + (b.g - a.g) * t),
-                    round(a.b + (b.b - a.b) * t),
-                    round(a.a + (b.a - a.a) * t),
-                )
+                self.kind = PropertyEaser.COLOR
+                self.delta = (b.r - a.r, b.g - a.g, b.b - a.b, b.a - a.a)
             else:
                 raise TypeError(f"Unsupported type for interpolation: {type(a)}")
 
+        def interpolate(self, t: float):
+            a = self.start_value
+            if self.kind == PropertyEaser.NUMBER:
+                return a + self.delta * t
+            elif self.kind == PropertyEaser.VECTOR:
+                return a.lerp(self.end_value, t)
+            dr, dg, db, da = self.delta
+            return pygame.Color(
+                round(a.r + dr * t),
+                round(a.g + dg * t),
+                round(a.b + db * t),
+                round(a.a + da * t),
+            )
+
+        def set(self, value) -> None:
+            if self.attr is not None:
+                setattr(self.obj, self.attr, value)
+            else:
+                self.setter(value)
+
         def apply(self, t: float):
-            self.setter(self.interpolate(t))
+            self.set(self.interpolate(t))
 
     def __init__(
         self,
@@ -39,16 +75,47 @@ class PropertyEaser(EasingController):
         end_callback: Callable[[], Any] = None,
     ):
         self.properties: list[PropertyEaser.EasedProperty] = []
-
-        def update_all(progress):
-            for prop in self.properties:
-                prop.apply(progress)
-
-        super().__init__(duration, easing, update_all, end_callback, loop, register)
+        self._numbers: list[PropertyEaser.EasedProperty] = []
+        self._others: list[PropertyEaser.EasedProperty] = []
+        self._starts = array("d")
+        self._deltas = array("d")
+        super().__init__(duration, easing, self._update_all, end_callback, loop, register)
 
     def __str__(self):
         return f"(PROP){super().__str__()}"
 
+    def _update_all(self, progress: float) -> None:
+        if self._numbers:
+            values = [s + d * progress for s, d in zip(self._starts, self._deltas)]
+            for prop, value in zip(self._numbers, values):
+                if prop.attr is not None:
+                    setattr(prop.obj, prop.attr, value)
+                else:
+                    prop.setter(value)
+        for prop in self._others:
+            prop.apply(progress)
+
+    def clear(self) -> Self:
+        """
+        Removes all properties
+        """
+        self.properties.clear()
+        self._numbers.clear()
+        self._others.clear()
+        del self._starts[:]
+        del self._deltas[:]
+        return self
+
+    def _add_property(self, prop: "PropertyEaser.EasedProperty") -> Self:
+        self.properties.append(prop)
+        if prop.kind == PropertyEaser.NUMBER:
+            self._numbers.append(prop)
+            self._starts.append(prop.start_value)
+            self._deltas.append(prop.delta)
+        else:
+            self._others.append(prop)
+        return self
+
     def add_attr(
         self,
         obj: Any,
@@ -56,15 +123,16 @@ class PropertyEaser(EasingController):
         end_value: Any,
         start_value: Any = None,
     )->Self:
-        self.properties.append(
+        return self._add_property(
             PropertyEaser.EasedProperty(
                 getter=lambda o=obj, a=attr: getattr(o, a),
                 setter=lambda v, o=obj, a=attr: setattr(o, a, v),
                 end_value=end_value,
                 start_value=start_value,
+                obj=obj,
+                attr=attr,
             )
         )
-        return self
 
     def add_custom(
         self,
@@ -73,7 +141,6 @@ class PropertyEaser(EasingController):
         end_value: Any,
         start_value: Any = None,
     )->Self:
-        self.properties.append(
+        return self._add_property(
             PropertyEaser.EasedProperty(getter, setter, end_value, start_value)
         )
-        return self
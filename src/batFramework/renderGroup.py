@@ -1,34 +1,185 @@
 import batFramework as bf
 import pygame
-from typing import Callable, Iterator
+from typing import Callable, Iterator, Self
 
 
 class RenderGroup(bf.Drawable):
+    """
+    Draws many Drawables with a single fblits call.
+    Members are added and removed explicitly. The group keeps a blit list sorted by render order
+    (then surface, to batch identical surfaces) and a grid of its members for culling.
+    Both are only patched when a member changes, and the blit list is reused as is while the camera
+    doesn't move.
+    Members notify the group when changed through set_position, set_center, set_size or set_visible.
+    If members are modified directly (rect, surface...), call refresh or make the group dynamic
+    (every member is checked for changes each frame).
+    Passing an entity_iterator makes the group dynamic and syncs its members with the iterator each frame.
+    """
     def __init__(
-        self, entity_iterator: Callable[[], Iterator[bf.Drawable]], blit_flags: int = 0
+        self,
+        entity_iterator: Callable[[], Iterator[bf.Drawable]] | None = None,
+        blit_flags: int = 0,
+        dynamic: bool = False,
+        cell_size: int = 256,
     ) -> None:
         super().__init__()
         self.entity_iterator = entity_iterator
         self.blit_flags = blit_flags
+        self.dynamic: bool = dynamic or entity_iterator is not None
+        self.cell_size: int = cell_size
+        self.members: dict[int, bf.Drawable] = {}  # key is uid
+        self._entries: dict[int, tuple] = {}  # uid -> (surface, x, y, visible, render_order)
+        self._cells: dict[int, list[tuple[int, int]]] = {}  # uid -> cells covered
+        self._grid: dict[tuple[int, int], set[int]] = {}  # cell -> uids
+        self._visible: list[tuple[pygame.Surface, float, float]] = []  # sorted, in world space
+        self._visible_key = None  # cell range the visible list was built for
+        self._fblits_data: list[tuple[pygame.Surface, tuple[float, float]]] = []
+        self._fblits_offset = None  # camera position the blit list was built for
         self.set_debug_color("white")
 
+    def __len__(self) -> int:
+        return len(self.members)
+
+    def __contains__(self, entity: bf.Drawable) -> bool:
+        return entity.uid in self.members
+
+    def add(self, *entities: bf.Drawable) -> Self:
+        layers = {}  # layers to sort once, at the end
+        for e in entities:
+            if e.uid in self.members:
+                continue
+            if e.render_group is not None:
+                e.render_group._remove(e)
+            self.members[e.uid] = e
+            e._set_render_group(self)
+            self._store(e)
+            if e.parent_layer:
+                layers[e.parent_layer] = None
+        for layer in layers:
+            layer.update_draw_order()
+        self._invalidate()
+        return self
+
+    def remove(self, *entities: bf.Drawable) -> Self:
+        layers = {}
+        for e in entities:
+            if self._remove(e) and e.parent_layer:
+                layers[e.parent_layer] = None
+        for layer in layers:
+            layer.update_draw_order()
+        self._invalidate()
+        return self
+
+    def _remove(self, entity: bf.Drawable) -> bool:
+        """
+        Removes the member without sorting its layer, returns False if it wasn't one
+        """
+        if self.members.pop(entity.uid, None) is None:
+            return False
+        self._unstore(entity.uid)
+        entity._set_render_group(None)
+        self._invalidate()
+        return True
+
+    def clear(self) -> Self:
+        return self.remove(*self.members.values())
+
+    def refresh(self, *entities: bf.Drawable) -> Self:
+        """
+        Updates the blit data of the given members (all members if none given).
+        Needed when members are modified without going through their setters
+        """
+        for e in entities or self.members.values():
+            self.refresh_member(e)
+        return self
+
+    def refresh_member(self, entity: bf.Drawable) -> None:
+        if entity.uid not in self.members:
+            return
+        if self._entries.get(entity.uid) != self._get_entry(entity):
+            self._unstore(entity.uid)
+            self._store(entity)
+            self._invalidate()
+
+    def _get_entry(self, e: bf.Drawable) -> tuple:
+        return (e.surface, e.rect.x, e.rect.y, e.visible, e.render_order)
+
+    def _store(self, e: bf.Drawable) -> None:
+        entry = self._get_entry(e)
+        self._entries[e.uid] = entry
+        cs = self.cell_size
+        left, top = int(e.rect.left // cs), int(e.rect.top // cs)
+        right, bottom = int(e.rect.right // cs), int(e.rect.bottom // cs)
+        cells = [(x, y) for x in range(left, right + 1) for y in range(top, bottom + 1)]
+        self._cells[e.uid] = cells
+        for cell in cells:
+            self._grid.setdefault(cell, set()).add(e.uid)
+
+    def _unstore(self, uid: int) -> None:
+        self._entries.pop(uid, None)
+        for cell in self._cells.pop(uid, ()):
+            uids = self._grid[cell]
+            uids.discard(uid)
+            if not uids:
+                del self._grid[cell]
+
+    def _invalidate(self) -> None:
+        self._visible_key = None
+        self._fblits_offset = None
+
+    def _sync_iterator(self) -> None:
+        entities = {e.uid: e for e in self.entity_iterator()}
+        removed = [e for uid, e in self.members.items() if uid not in entities]
+        if removed:
+            self.remove(*removed)
+        added = [e for uid, e in entities.items() if uid not in self.members]
+        if added:
+            self.add(*added)
+
+    def _build_visible(self, key: tuple[int, int, int, int]) -> None:
+        left, top, right, bottom = key
+        grid = self._grid
+        if len(grid) <= (right - left + 1) * (bottom - top + 1):
+            uids = set().union(
+                *(uids for (x, y), uids in grid.items() if left <= x <= right and top <= y <= bottom)
+            )
+        else:
+            uids = set().union(
+                *(grid[cell] for x in range(left, right + 1) for y in range(top, bottom + 1) if (cell := (x, y)) in grid)
+            )
+        entries = [self._entries[uid] for uid in uids]
+        entries = [e for e in entries if e[3]]
+        entries.sort(key=lambda e: (e[4], id(e[0])))
+        self._visible = [(e[0], e[1], e[2]) for e in entries]
+        self._visible_key = key
+        self._fblits_offset = None
+
     def draw(self, camera: bf.Camera) -> None:
         if not self.visible:
             return
+        if self.entity_iterator is not None:
+            self._sync_iterator()
+        if self.dynamic:
+            for e in self.members.values():
+                self.refresh_member(e)
 
-        fblits_data = []
-        for e in self.entity_iterator():
-            if not getattr(e, "drawn_by_group", False):
-                # Set flag to skip their individual draw call
-                e.drawn_by_group = True
+        world_rect = camera.world_rect
+        cs = self.cell_size
+        key = (
+            int(world_rect.left // cs), int(world_rect.top // cs),
+            int(world_rect.right // cs), int(world_rect.bottom // cs),
+        )
+        if key != self._visible_key:
+            self._build_visible(key)
 
-            if e.visible and camera.rect.colliderect(e.rect):
-                fblits_data.append(
-                    (e.surface, (e.rect.x - camera.rect.x, e.rect.y - camera.rect.y))
-                )
+        offset = (world_rect.x, world_rect.y)
+        if offset != self._fblits_offset:
+            ox, oy = offset
+            self._fblits_data = [(s, (x - ox, y - oy)) for s, x, y in self._visible]
+            self._fblits_offset = offset
 
-        camera.surface.fblits(fblits_data, self.blit_flags)
+        camera.surface.fblits(self._fblits_data, self.blit_flags)
 
     def get_debug_outlines(self):
-        for e in self.entity_iterator():
+        for e in self.members.values():
             yield from e.get_debug_outlines()
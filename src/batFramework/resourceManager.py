@@ -52,7 +52,13 @@ class ResourceManager(metaclass=Singleton):
                 if file.lower().endswith((".png", ".jpg", ".jpeg", ".gif")):
                     self.load_image(file_path)
                 elif file.lower().endswith((".mp3", ".wav", ".ogg")):
-                    bf.AudioManager().load_sound(file.split(".")[0], file_path)
+                    # sounds are decoded on first play, long files are streamed
+                    audio = bf.AudioManager()
+                    if os.path.getsize(file_path) > audio.stream_threshold:
+                        policy = bf.loadPolicy.STREAMED
+                    else:
+                        policy = bf.loadPolicy.LAZY
+                    audio.load_sound(file.split(".")[0], file_path, policy=policy)
                 elif file.lower().endswith((".ttf", ".otf")):
                     bf.FontManager().load_font(file_path, file.split(".")[0])
 
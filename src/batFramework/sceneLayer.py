@@ -4,6 +4,7 @@ import batFramework as bf
 import pygame
 from .entity import Entity
 from .drawable import Drawable
+from .lightEntity import LightEntity, LightDrawable
 
 from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
@@ -16,6 +17,8 @@ class SceneLayer:
     Allows sorting out  different types of content in a single scene 
     One common use would be to separate GUI and game into two separate layers
     Entities are drawn only if they inherit the Drawable class and are not in a RenderGroup
+    LightDrawables are drawn in bulk (before other entities) if the layer has a TransformStore
+    Events go through the layer's InputRouter : only entities subscribed to an event type receive it
     """
     def __init__(self,name:str,convert_alpha:bool = False):
         self.scene = None
@@ -24,7 +27,11 @@ class SceneLayer:
         self.entities_to_add : set[Entity]= set() # entities to add to the scene, (1 frame delay after calling add)
         self.entities_to_remove : set[Entity]= set() # entities to remove from the scene 
         self.draw_order : list[int] = [] # stores the uid of entities to draw (in draw order)
+        self.tag_index : dict[str,set[int]] = {} # tag -> uids of entities having it
         self.camera = bf.Camera(convert_alpha=convert_alpha)
+        self.animation_system = bf.AnimationSystem() # advances all AnimatedSprites of the layer
+        self.input_router = bf.InputRouter() # dispatches events to subscribed entities
+        self.transform_store : bf.TransformStore | None = None # stores LightEntities transforms when set
 
     def set_clear_color(self,color):
         self.camera.set_clear_color(color)
@@ -32,14 +39,63 @@ class SceneLayer:
     def set_scene(self, scene:BaseScene):
         self.scene = scene
 
-    def add(self,*entities:Entity):
+    def set_transform_store(self, store: bf.TransformStore | None):
+        """
+        LightEntities added to the layer after this call will have their transform stored in it
+        """
+        self.transform_store = store
+
+    def add(self,*entities:Entity|LightEntity):
         for e in entities:
             if e.uid not in self.entities and e not in self.entities_to_add:
                 self.entities_to_add.add(e)
 
 
     def get_by_tags(self,*tags)->list[Entity]:
-        return [v for v in self.entities.values() if v.has_tags(*tags) ]
+        """
+        Returns entities having all given tags (all entities if no tag is given)
+        """
+        if not tags:
+            return list(self.entities.values())
+        uid_sets = []
+        for tag in tags:
+            uids = self.tag_index.get(tag)
+            if not uids:
+                return []
+            uid_sets.append(uids)
+        uid_sets.sort(key=len)
+        uids = uid_sets[0].intersection(*uid_sets[1:]) if len(uid_sets) > 1 else uid_sets[0]
+        return [self.entities[uid] for uid in uids]
+
+    def get_by_any_tags(self,*tags)->list[Entity]:
+        """
+        Returns entities having at least one of the given tags
+        """
+        uids = set().union(*(self.tag_index.get(tag,()) for tag in tags))
+        return [self.entities[uid] for uid in uids]
+
+    def index_tags(self,entity:Entity|LightEntity,tags):
+        """
+        Called by entities of the layer when tags are added to them
+        """
+        if self.entities.get(entity.uid) is not entity:
+            return
+        for tag in tags:
+            self.tag_index.setdefault(tag,set()).add(entity.uid)
+
+    def unindex_tags(self,entity:Entity|LightEntity,tags):
+        """
+        Called by entities of the layer when tags are removed from them
+        """
+        if self.entities.get(entity.uid) is not entity:
+            return
+        for tag in tags:
+            uids = self.tag_index.get(tag)
+            if uids is None:
+                continue
+            uids.discard(entity.uid)
+            if not uids:
+                del self.tag_index[tag]
 
     def get_by_uid(self,uid:int)->Entity|None:
         return self.entities.get(uid,None)
@@ -53,11 +109,21 @@ class SceneLayer:
         if self.camera.fullscreen and event.type == pygame.VIDEORESIZE and not pygame.SCALED & bf.const.FLAGS:
             self.camera.set_size(bf.const.RESOLUTION)
 
-        for e in self.entities.values():
-            e.process_event(event)
-            if event.consumed : return
+        self.input_router.process_event(event)
+
+    def get_input(self)->bf.InputSnapshot:
+        """
+        Returns the input state of the current frame
+        """
+        return self.input_router.snapshot
 
     def update(self, dt):
+        # Input state of the frame
+        self.input_router.update(self.camera)
+
+        # Advance animations
+        self.animation_system.update(dt)
+
         # Update all entities
         for e in self.entities.values():
             e.update(dt)
@@ -66,6 +132,7 @@ class SceneLayer:
 
         # Update the camera
         self.camera.update(dt)
+        self.input_router.reset()
 
     def flush_entity_changes(self):
         """
@@ -75,7 +142,10 @@ class SceneLayer:
         # Remove entities marked for removal
         for e in self.entities_to_remove:
             if e.uid in self.entities.keys():
+                if e.tags:
+                    self.unindex_tags(e,e.tags)
                 e.set_parent_scene(None)
+                self.input_router.unsubscribe(e)
                 self.entities.pop(e.uid)
         self.entities_to_remove.clear()
 
@@ -83,9 +153,12 @@ class SceneLayer:
         reorder = False
         for e in self.entities_to_add:
             self.entities[e.uid] = e
+            if e.tags:
+                self.index_tags(e,e.tags)
             e.set_parent_layer(self)
             e.set_parent_scene(self.scene)
-            if not reorder and isinstance(e, Drawable):
+            self.input_router.add_entity(e)
+            if not reorder and isinstance(e, (Drawable, LightDrawable)):
                 reorder = True
         self.entities_to_add.clear()
 
@@ -97,6 +170,8 @@ class SceneLayer:
     def draw(self, surface: pygame.Surface):
         self.camera.clear()
         debugMode = bf.ResourceManager().get_sharedVar("debug_mode")
+        if self.transform_store is not None:
+            self.transform_store.draw(self.camera)
         # Draw entities in the correct order
         for uid in self.draw_order:
             if uid in self.entities and not self.entities[uid].drawn_by_group:  # Ensure the entity still exists
@@ -105,13 +180,15 @@ class SceneLayer:
         # Draw debug outlines if in debug mode
         if debugMode == bf.debugMode.OUTLINES:
             [self.debug_entity(uid) for uid in self.draw_order if uid in self.entities]
+            if self.transform_store is not None:
+                [self.debug_entity(e.uid) for e in self.transform_store.entities if e is not None and e.uid in self.entities]
 
         # surface.fill("white")
         self.camera.draw(surface)
 
     def update_draw_order(self):
         self.draw_order = sorted(
-            (k for k,v in self.entities.items() if isinstance(v,Drawable) and not v.drawn_by_group),
+            (k for k,v in self.entities.items() if isinstance(v,(Drawable,LightDrawable)) and not v.drawn_by_group),
             key= lambda uid : self.entities[uid].render_order
         )
 
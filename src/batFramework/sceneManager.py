@@ -11,6 +11,7 @@ class SceneManager:
         self.scenes: list[bf.BaseScene] = []
         self.shared_events = {pygame.WINDOWRESIZED}
         self.current_transition : tuple[str,bf.transition.Transition,int] | None= None
+        self._transition_buffers : tuple[pygame.Surface,pygame.Surface] | None = None # reused source and dest surfaces
 
     def init_scenes(self, *initial_scenes:bf.Scene):
         for index, s in enumerate(initial_scenes):
@@ -122,8 +123,10 @@ class SceneManager:
             print(f"No scene exists at index {index}.")
             return       
         
-        source_surface = bf.const.SCREEN.copy()
-        dest_surface = bf.const.SCREEN.copy()
+        source_surface, dest_surface = self._get_transition_buffers(bf.const.SCREEN)
+        source_surface.blit(bf.const.SCREEN, (0, 0))
+        if target_scene.get_clear_color() is None: # a scene without clear color draws over the current screen
+            dest_surface.blit(source_surface, (0, 0))
 
         target_scene.draw(dest_surface) # draw at least once to ensure smooth transition
         target_scene.set_active(True)
@@ -188,13 +191,34 @@ class SceneManager:
     def do_update(self, dt: float):
         pass
 
+    def _get_transition_buffers(self, surface: pygame.Surface) -> tuple[pygame.Surface, pygame.Surface]:
+        """
+        Returns the source and dest surfaces of transitions, created once per screen size
+        """
+        size = surface.get_size()
+        if self._transition_buffers is None or self._transition_buffers[0].get_size() != size:
+            self._transition_buffers = (
+                pygame.Surface(size, 0, surface),
+                pygame.Surface(size, 0, surface),
+            )
+        return self._transition_buffers
+
     def draw(self, surface:pygame.Surface) -> None:
+        if self.current_transition is None:
+            for scene in self.visible_scenes:
+                scene.draw(surface)
+            return
+        # scenes are drawn into the reused buffers, the transition composes them onto the surface
+        # (source is kept between frames like the screen is, scenes with a clear color clear it)
+        source, dest = self._get_transition_buffers(surface)
         for scene in self.visible_scenes:
-            scene.draw(surface)
-        if self.current_transition is not None:
-            self.current_transition[1].set_source(surface)
-            tmp = surface.copy()
-            self.get_scene(self.current_transition[0]).draw(tmp)
-            self.current_transition[1].set_dest(tmp)
-            self.current_transition[1].draw(surface)
+            scene.draw(source)
+        target_scene = self.get_scene(self.current_transition[0])
+        if target_scene.get_clear_color() is None: # draws over the scenes below, as it would on the screen
+            dest.blit(source, (0, 0))
+        target_scene.draw(dest)
+        transition = self.current_transition[1]
+        transition.set_source(source)
+        transition.set_dest(dest)
+        transition.draw(surface)
 
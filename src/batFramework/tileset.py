@@ -4,43 +4,64 @@ import batFramework as bf
 
 
 class Tileset:
-    def __init__(self, source: pygame.Surface, tilesize: tuple[int, int]) -> None:
+    def __init__(self, source: pygame.Surface, tilesize: tuple[int, int], eager_flip: bool = False) -> None:
+        """
+        Tiles are stored in a flat list indexed by tile id (y * tile_width + x).
+        Flipped versions of a tile are created the first time they are requested and then cached.
+        Use eager_flip (or warm_up) to create them all right away.
+        """
         self.surface = source
         self.tile_size = tilesize
         self.tile_width = source.get_width() // tilesize[0]
         self.tile_height = source.get_height() // tilesize[1]
-        # Create flipped versions of the tileset surface
-        self.flipped_surfaces = {
-            (False, False): self.surface,
-            (False, True): pygame.transform.flip(self.surface, False, True),
-            (True, False): pygame.transform.flip(self.surface, True, False),
-            (True, True): pygame.transform.flip(self.surface, True, True),
-        }
 
-        # Split each of the surfaces into tiles
-        self.tile_dict = {}
-        for flip_state, surf in self.flipped_surfaces.items():
-            tiles = bf.utils.split_surface(surf, self.tile_size)
-            for coord, tile in tiles.items():
-                if coord not in self.tile_dict:
-                    self.tile_dict[coord] = {}
-                self.tile_dict[coord][flip_state] = tile
+        self.tiles: list[pygame.Surface] = [
+            source.subsurface((x * tilesize[0], y * tilesize[1], *tilesize))
+            for y in range(self.tile_height)
+            for x in range(self.tile_width)
+        ]
+        # flipped tiles, key is (flipX, flipY)
+        self.flipped_tiles: dict[tuple[bool, bool], list[pygame.Surface | None]] = {
+            flip_state: [None] * len(self.tiles)
+            for flip_state in ((False, True), (True, False), (True, True))
+        }
+        if eager_flip:
+            self.warm_up()
 
     def __str__(self) -> str:
-        num_tiles = 0
-        if self.tile_dict:
-            num_tiles = len(self.tile_dict.values())
-        return f"{num_tiles} tiles | Tile size : {self.tile_size}"
+        return f"{len(self.tiles)} tiles | Tile size : {self.tile_size}"
+
+    def warm_up(self) -> None:
+        """
+        Creates all flipped tiles that were not requested yet
+        """
+        for flip_x, flip_y in self.flipped_tiles:
+            for tile_id in range(len(self.tiles)):
+                self.get_tile_by_id(tile_id, flip_x, flip_y)
+
+    def get_tile_id(self, x: int, y: int) -> int | None:
+        if not (0 <= x < self.tile_width and 0 <= y < self.tile_height):
+            return None
+        return y * self.tile_width + x
+
+    def get_tile_by_id(
+        self, tile_id: int, flipX=False, flipY=False
+    ) -> pygame.Surface | None:
+        if not 0 <= tile_id < len(self.tiles):
+            return None
+        if not (flipX or flipY):
+            return self.tiles[tile_id]
+        cache = self.flipped_tiles[(bool(flipX), bool(flipY))]
+        tile = cache[tile_id]
+        if tile is None:
+            tile = pygame.transform.flip(self.tiles[tile_id], flipX, flipY)
+            cache[tile_id] = tile
+        return tile
 
     def get_tile(
         self, x: int, y: int, flipX=False, flipY=False
     ) -> pygame.Surface | None:
-        if flipX:
-            x = self.tile_width - 1 - x
-        if flipY:
-            y = self.tile_height - 1 - y
-        tile_data = self.tile_dict.get((x, y), None)
-        if tile_data is None:
+        tile_id = self.get_tile_id(x, y)
+        if tile_id is None:
             return None
-
-        return tile_data.get((flipX, flipY), None)
+        return self.get_tile_by_id(tile_id, flipX, flipY)
@@ -6,11 +6,7 @@ class Timer:
     _available_ids: set[int] = set()
 
     def __init__(self, duration: float, end_callback: Callable[[], Any], loop: int = 0, register: str = "global") -> None:
-        if Timer._available_ids:
-            self.uid = Timer._available_ids.pop()
-        else:
-            self.uid = Timer._count
-            Timer._count += 1
+        self.uid: int | None = Timer._new_id()
 
         self.register = register
         self.duration: float = duration
@@ -48,6 +44,8 @@ class Timer:
         """
         if self.elapsed_time > 0 and not force:
             return self
+        if self.uid is None:  # restarted after being removed from its register
+            self.uid = Timer._new_id()
         if not bf.TimeManager().add_timer(self, self.register):
             return self
         self.elapsed_time = 0
@@ -132,8 +130,19 @@ class Timer:
         """
         return self.is_over or self.do_delete
 
+    @staticmethod
+    def _new_id() -> int:
+        if Timer._available_ids:
+            return Timer._available_ids.pop()
+        uid = Timer._count
+        Timer._count += 1
+        return uid
+
     def _release_id(self):
+        if self.uid is None:
+            return
         Timer._available_ids.add(self.uid)
+        self.uid = None  # the id may be given to another timer now
 
 class SceneTimer(Timer):
     """
@@ -154,16 +163,24 @@ class TimeManager(metaclass=bf.Singleton):
         def add_timer(self, timer: Timer):
             self.timers[timer.uid] = timer
 
+        def remove_timer(self, timer: Timer) -> bool:
+            if timer.uid is None or self.timers.get(timer.uid) is not timer:
+                return False
+            del self.timers[timer.uid]
+            timer._release_id()
+            return True
+
         def update(self, dt):
             expired_timers = []
             for timer in list(self.timers.values()):
                 if not timer.is_paused:
                     timer.update(dt)
                 if timer.should_delete():
-                    expired_timers.append(timer.uid)
-            for uid in expired_timers:
-                self.timers[uid]._release_id()
-                del self.timers[uid]
+                    expired_timers.append(timer)
+            # the timers themselves, not their ids : a callback may have released an id and given it to another timer
+            for timer in expired_timers:
+                if timer.should_delete():  # not restarted by a later callback
+                    self.remove_timer(timer)
 
     def __init__(self):
         self.registers = {"global": TimeManager.TimerRegister()}
@@ -186,6 +203,14 @@ class TimeManager(metaclass=bf.Singleton):
         print(f"Register '{register}' does not exist.")
         return False
 
+    def remove_timer(self, timer: Timer) -> None:
+        """
+        Removes the timer from its register right away (without calling its end_callback)
+        """
+        register = self.registers.get(timer.register)
+        if register is not None:
+            register.remove_timer(timer)
+
     def get_active_registers(self) -> list[TimerRegister]:
         return [t for t in self.registers.values() if t.active]
 
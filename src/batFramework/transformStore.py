@@ -0,0 +1,124 @@
+from array import array
+import pygame
+import batFramework as bf
+from typing import TYPE_CHECKING
+from .lightEntity import LightDrawable
+
+if TYPE_CHECKING:
+    from .lightEntity import LightEntity
+
+
+class TransformStore:
+    """
+    Keeps position and size of many LightEntities in contiguous arrays.
+    Bound entities read and write their transform from the store,
+    so whole groups can be moved, culled and drawn without touching each entity object.
+    Give one to a SceneLayer (set_transform_store) to have its LightDrawables drawn in bulk.
+    Drawables keep their own blit flags (the store's blit_flags is used for those without) :
+    consecutive drawables sharing the same flags are drawn with one fblits call.
+    Drawables in a RenderGroup are left to their group.
+    """
+
+    def __init__(self, blit_flags: int = 0) -> None:
+        self.x = array("d")
+        self.y = array("d")
+        self.w = array("d")
+        self.h = array("d")
+        self.entities: list["LightEntity | None"] = []
+        self.blit_flags: int = blit_flags  # default for drawables without blit flags
+        self.dirty_order: bool = False
+        self._free: list[int] = []
+        self._order: list[int] = []  # indices of drawables, in render order
+
+    def __len__(self) -> int:
+        return len(self.entities) - len(self._free)
+
+    def add(self, entity: "LightEntity", x: float, y: float, w: float, h: float) -> int:
+        """
+        Stores the transform of the entity, returns its index
+        """
+        if self._free:
+            index = self._free.pop()
+            self.entities[index] = entity
+            self.x[index], self.y[index], self.w[index], self.h[index] = x, y, w, h
+        else:
+            index = len(self.entities)
+            self.entities.append(entity)
+            self.x.append(x)
+            self.y.append(y)
+            self.w.append(w)
+            self.h.append(h)
+        self.dirty_order = True
+        return index
+
+    def remove(self, entity: "LightEntity") -> None:
+        index = entity._index
+        if not (0 <= index < len(self.entities)) or self.entities[index] is not entity:
+            return
+        self.entities[index] = None
+        self.w[index] = self.h[index] = 0
+        self._free.append(index)
+        self.dirty_order = True
+
+    def get_rect(self, index: int) -> pygame.FRect:
+        return pygame.FRect(self.x[index], self.y[index], self.w[index], self.h[index])
+
+    def translate(self, dx: float, dy: float) -> None:
+        """
+        Moves every stored entity
+        """
+        self.x = array("d", [x + dx for x in self.x])
+        self.y = array("d", [y + dy for y in self.y])
+
+    def query(self, rect: pygame.typing.RectLike) -> list["LightEntity"]:
+        """
+        Returns all stored entities colliding with the rect
+        """
+        left, top, w, h = rect
+        right, bottom = left + w, top + h
+        return [
+            e for e, x, y, ew, eh in zip(self.entities, self.x, self.y, self.w, self.h)
+            if e is not None and x < right and y < bottom and x + ew > left and y + eh > top
+        ]
+
+    def _update_order(self) -> None:
+        entities = self.entities
+        self._order = sorted(
+            (i for i, e in enumerate(entities) if isinstance(e, LightDrawable)),
+            key=lambda i: entities[i].render_order,
+        )
+        self.dirty_order = False
+
+    def draw(self, camera: bf.Camera) -> None:
+        """
+        Draws all visible drawables of the store, one fblits call per run of identical blit flags
+        """
+        if self.dirty_order:
+            self._update_order()
+        world_rect = camera.world_rect
+        left, top, right, bottom = world_rect.left, world_rect.top, world_rect.right, world_rect.bottom
+        xs, ys, ws, hs, entities = self.x, self.y, self.w, self.h, self.entities
+        surface = camera.surface
+        default_flags = self.blit_flags
+        fblits_data = []
+        run_flags = default_flags
+        for i in self._order:
+            x = xs[i]
+            y = ys[i]
+            if x < right and y < bottom and x + ws[i] > left and y + hs[i] > top:
+                e = entities[i]
+                if e.visible and e.surface is not None and e.render_group is None:
+                    flags = e.blit_flags or default_flags
+                    if flags != run_flags:
+                        if fblits_data:
+                            surface.fblits(fblits_data, run_flags)
+                            fblits_data = []
+                        run_flags = flags
+                    fblits_data.append((e.surface, (x - left, y - top)))
+        if fblits_data:
+            surface.fblits(fblits_data, run_flags)
+
+    def get_debug_outlines(self):
+        for e in self.entities:
+            if e is not None:
+                yield from e.get_debug_outlines()
@@ -1,6 +1,7 @@
 import batFramework as bf
 from typing import Self,Callable,Any
 import pygame
+import math
 
 """
 Both surfaces to transition need to be the same size
@@ -65,46 +66,56 @@ class Transition:
 class FadeColor(Transition):
     def __init__(self,duration:float,color=(0,0,0),color_start:float=0.3,color_end:float=0.7, easing = bf.easing.LINEAR):
         super().__init__(duration, easing)
-        self.color = color
+        self.color = pygame.Color(color)
         self.color_start = color_start
         self.color_end = color_end
 
-    def start(self):
-        super().start()
-        self.color_surf = pygame.Surface(self.source.get_size())
-        self.color_surf.fill(self.color)
+    def _fade_to_color(self, surface: pygame.Surface, v: float) -> None:
+        # surface = surface * (1-v) + color * v, done in place with two fills
+        keep = int(255 * (1 - v))
+        surface.fill((keep, keep, keep), special_flags=pygame.BLEND_RGB_MULT)
+        surface.fill(
+            (int(self.color.r * v), int(self.color.g * v), int(self.color.b * v)),
+            special_flags=pygame.BLEND_RGB_ADD,
+        )
 
     def draw(self, surface):
         v = self.controller.get_value()
         if v < self.color_start:
-            v = v/(self.color_start)
-            self.color_surf.set_alpha(255*v)
-            surface.blit(self.source)
-            surface.blit(self.color_surf)
+            surface.blit(self.source, (0, 0))
+            self._fade_to_color(surface, v / self.color_start)
 
         elif v < self.color_end:
-            self.color_surf.set_alpha(255)
-            surface.blit(self.color_surf)
+            surface.fill(self.color)
 
         else:
             v = (v-self.color_end)/(1-self.color_end)
-            surface.blit(self.color_surf)
-            self.dest.set_alpha(255*v)
-            surface.blit(self.dest)
+            surface.fill(self.color)
+            self._fade_to_color(surface, 1 - v)
+            blend_add(surface, self.dest, v)
+
+
+def blend_add(surface: pygame.Surface, dest: pygame.Surface, v: float) -> None:
+    """
+    Adds dest * v to surface with blend flags (no per surface alpha).
+    dest is scaled in place : it is drawn again by the SceneManager every frame
+    """
+    k = int(255 * v)
+    dest.fill((k, k, k), special_flags=pygame.BLEND_RGB_MULT)
+    surface.blit(dest, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
 
-class Fade(Transition):
-    def end(self):
-        self.dest.set_alpha(255)
-        return super().end()
 
+class Fade(Transition):
     def start(self):
         super().start()
 
     def draw(self, surface):
-        dest_alpha = 255 * self.controller.get_value()
-        self.dest.set_alpha(dest_alpha)
+        # surface = source * (1-v) + dest * v
+        v = self.controller.get_value()
+        k = 255 - int(255 * v)
         surface.blit(self.source, (0, 0))
-        surface.blit(self.dest, (0, 0))
+        surface.fill((k, k, k), special_flags=pygame.BLEND_RGB_MULT)
+        blend_add(surface, self.dest, v)
 
 class GlideRight(Transition):
     def draw(self, surface):
@@ -122,41 +133,41 @@ class GlideLeft(Transition):
         surface.blit(self.dest, (source_x - width, 0))
 
 
-class CircleOut(Transition):
-    def start(self):
-        super().start()
-        self.circle_surf = self.source.copy()
-        self.circle_surf.set_colorkey((0, 0, 0))
-        self.circle_surf.fill((0, 0, 0))
-        self.surface_width = self.circle_surf.get_width()
+def blit_circle(surface: pygame.Surface, source: pygame.Surface, radius: float) -> None:
+    """
+    Blits the part of source inside a circle centered on the surface, one row at a time
+    (only the pixels of the circle are copied, no mask is built)
+    """
+    width, height = surface.get_size()
+    cx, cy = width / 2, height / 2
+    if radius <= 0:
+        return
+    if radius * radius >= cx * cx + cy * cy:  # covers the whole surface
+        surface.blit(source, (0, 0))
+        return
+    r2 = radius * radius
+    rows = []
+    for y in range(max(0, int(cy - radius)), min(height, int(cy + radius) + 1)):
+        dy = y + 0.5 - cy
+        if dy * dy >= r2:
+            continue
+        dx = math.sqrt(r2 - dy * dy)
+        left = max(0, int(cx - dx))
+        right = min(width, int(cx + dx))
+        if right > left:
+            rows.append((source, (left, y), (left, y, right - left, 1)))
+    surface.blits(rows, doreturn=False)
 
+
+class CircleOut(Transition):
     def draw(self, surface):
         v = self.controller.get_value()
-
-        radius = self.surface_width * v
-        pygame.draw.circle(
-            self.circle_surf, "white", self.circle_surf.get_rect().center, radius
-        )
-        mask = pygame.mask.from_surface(self.circle_surf)
-        mask.to_surface(surface=surface, setsurface=self.dest, unsetsurface=self.source)
+        surface.blit(self.source, (0, 0))
+        blit_circle(surface, self.dest, surface.get_width() * v)
 
 
 class CircleIn(Transition):
-    def start(self):
-        super().start()
-        self.circle_surf = self.source.copy()
-        self.circle_surf.set_colorkey((0, 0, 0))
-        self.circle_surf.fill((0, 0, 0))
-        self.surface_width = self.circle_surf.get_width()
-
     def draw(self, surface):
         v = self.controller.get_value()
-        radius = self.surface_width - (self.surface_width * v)
-        self.circle_surf.fill((0, 0, 0))
-        pygame.draw.circle(
-            self.circle_surf, "white", self.circle_surf.get_rect().center, radius
-        )
-        mask = pygame.mask.from_surface(self.circle_surf)
-        mask.to_surface(surface=surface, setsurface=self.source, unsetsurface=self.dest)
-
-
+        surface.blit(self.dest, (0, 0))
+        blit_circle(surface, self.source, surface.get_width() * (1 - v))
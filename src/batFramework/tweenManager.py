@@ -0,0 +1,90 @@
+import batFramework as bf
+from typing import Callable, Any
+
+
+class TweenManager(metaclass=bf.Singleton):
+    """
+    Keeps at most one running tween per (target, property).
+    Tweening a property toward the value it already goes to (or already has) does nothing,
+    tweening it toward another value retargets the running tween from the current value.
+    Finished tweens are kept in a pool and reused, so calling tween every frame doesn't allocate.
+    """
+
+    POOL_SIZE = 32
+
+    def __init__(self) -> None:
+        self._tweens: dict[tuple[int, str], bf.PropertyEaser] = {}  # (id(target), property name) -> tween
+        self._pool: list[bf.PropertyEaser] = []
+
+    def __len__(self) -> int:
+        return len(self._tweens)
+
+    def get_tween(self, target: Any, attr: str) -> bf.PropertyEaser | None:
+        return self._tweens.get((id(target), attr))
+
+    def tween(
+        self,
+        target: Any,
+        attr: str,
+        end_value: Any,
+        duration: float = 0.2,
+        easing: bf.easing = bf.easing.LINEAR,
+        register: str = "global",
+        end_callback: Callable[[], Any] = None,
+        getter: Callable[[], Any] = None,
+        setter: Callable[[Any], None] = None,
+    ) -> bf.PropertyEaser | None:
+        """
+        Eases target.attr (or the getter/setter pair, attr then only names the property) to end_value.
+        Returns the running tween, or None if the property already has the value
+        """
+        key = (id(target), attr)
+        tween = self._tweens.get(key)
+        if tween is not None and tween.properties:
+            if tween.properties[0].end_value == end_value:
+                return tween
+        else:
+            current = getter() if getter is not None else getattr(target, attr)
+            if current == end_value:
+                return None
+            tween = self._pool.pop() if self._pool else bf.PropertyEaser()
+            self._tweens[key] = tween
+
+        tween.clear()
+        if getter is not None:
+            tween.add_custom(getter, setter, end_value)
+        else:
+            tween.add_attr(target, attr, end_value)
+        tween.duration = duration
+        tween.easing_function = easing
+        tween.loop = 0
+        tween.end_callback = lambda: self._on_end(key, tween, end_callback)
+        if tween.register != register:
+            bf.TimeManager().remove_timer(tween)
+            tween.register = register
+        tween.do_delete = False
+        tween.start(force=True)
+        return tween
+
+    def cancel(self, target: Any, attr: str) -> None:
+        """
+        Stops the tween of the property where it is
+        """
+        tween = self._tweens.pop((id(target), attr), None)
+        if tween is not None:
+            tween.stop()
+            bf.TimeManager().remove_timer(tween)
+            self._release(tween)
+
+    def _release(self, tween: bf.PropertyEaser) -> None:
+        tween.clear()  # don't keep targets alive
+        tween.end_callback = None
+        if len(self._pool) < self.POOL_SIZE:
+            self._pool.append(tween)
+
+    def _on_end(self, key: tuple[int, str], tween: bf.PropertyEaser, end_callback: Callable[[], Any] | None) -> None:
+        if self._tweens.get(key) is tween:
+            del self._tweens[key]
+        if end_callback:
+            end_callback()
+        self._release(tween)